@@ -30,6 +30,8 @@ class Beam:
 
     Methods
     -------
+    reposition(data_norm, event, plot_setup)
+        Positions the beam and detector for another irradiation event.
     check_hit(patient)
         Calculates which of the patient phantom's entrance skin cells are hit
         by the X-ray beam. For 3D phantoms, skin cells on the beams exit path
@@ -56,6 +58,40 @@ class Beam:
             implementing currently unsupported venor RDSR files (the default is
             False).
 
+        """
+        # Manually create vertex index vector for the X-ray beam
+        self.ijk = np.column_stack((
+            [0, 0, 0, 0, 1, 1],
+            [1, 1, 3, 3, 2, 3],
+            [2, 4, 2, 4, 3, 4]))
+
+        # Manually construct vertex index vector for the X-ray detector
+        self.det_ijk = np.column_stack((
+            [0, 0, 4, 4, 0, 1, 0, 3, 3, 7, 1, 1],
+            [1, 2, 5, 6, 1, 5, 3, 7, 2, 2, 2, 6],
+            [2, 3, 6, 7, 4, 4, 4, 4, 7, 6, 6, 5]))
+
+        self.reposition(data_norm=data_norm, event=event,
+                        plot_setup=plot_setup)
+
+    def reposition(self, data_norm: pd.DataFrame, event: int,
+                   plot_setup: bool = False) -> None:
+        """Position the beam and detector for a specific irradiation event.
+
+        Updates the beam and detector vertices and the beam face normals,
+        while the vertex index vectors are kept. This allows one Beam to be
+        reused for all events in a procedure.
+
+        Parameters
+        ----------
+        data_norm : pd.DataFrame
+            Dicom RDSR information from each irradiation event. See
+            rdsr_normalizer.py for more information.
+        event : int
+            Specifies the index of the irradiation event in the procedure.
+        plot_setup : bool, optional
+            If True, a beam of zero angulation is created, see __init__.
+
         """
         # Override beam angulation if plot_setup
         if plot_setup:
@@ -103,12 +139,6 @@ class Beam:
 
         self.r = r
 
-        # Manually create vertex index vector for the X-ray beam
-        self.ijk = np.column_stack((
-            [0, 0, 0, 0, 1, 1],
-            [1, 1, 3, 3, 2, 3],
-            [2, 4, 2, 4, 3, 4]))
-
         # Create unit vectors from X-ray source to beam verticies
         v = ((self.r[1:] - self.r[0, :]).T /
              np.linalg.norm(self.r[1:] - self.r[0, :], axis=1)).T
@@ -142,12 +172,6 @@ class Beam:
         det_r = np.matmul(np.matmul(R2, R1).T, det_r.T).T
         self.det_r = det_r
 
-        # Manually construct vertex index vector for the X-ray detector
-        self.det_ijk = np.column_stack((
-            [0, 0, 4, 4, 0, 1, 0, 3, 3, 7, 1, 1],
-            [1, 2, 5, 6, 1, 5, 3, 7, 2, 2, 2, 6],
-            [2, 3, 6, 7, 4, 4, 4, 4, 7, 6, 6, 5]))
-
     def check_hit(self, patient: Phantom) -> List[bool]:
         """Calculate which patient entrance skin cells are hit by the beam.
 
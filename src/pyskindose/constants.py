@@ -60,6 +60,8 @@ KEY_RDSR_CONTENT_SEQUENCE = 'ContentSequence'
 KEY_RDSR_DATE_TIME = 'DateTime'
 KEY_RDSR_DETECTORSIZE_MM = 'DetectorSize_mm'
 KEY_RDSR_EVENT_XRAY_DATA = 'Irradiation Event X-Ray Data'
+# DICOM code value (scheme DCM) of 'Irradiation Event X-Ray Data'
+KEY_RDSR_EVENT_XRAY_DATA_CODE_VALUE = '113706'
 KEY_RDSR_II_DIAMETER_SRDATA = 'iiDiameter SRData'
 KEY_RDSR_MANUFACTURER = 'Manufacturer'
 KEY_RDSR_MANUFACTURER_MODEL_NAME = 'ManufacturerModelName'
@@ -67,6 +69,13 @@ KEY_RDSR_MEASURED_VALUE_SEQUENCE = 'MeasuredValueSequence'
 KEY_RDSR_TEXT_VALUE = 'TextValue'
 KEY_RDSR_UID = 'UID'
 
+# DICOM SR content item value types, used to dispatch RDSR content parsing
+KEY_RDSR_VALUE_TYPE_CODE = 'CODE'
+KEY_RDSR_VALUE_TYPE_CONTAINER = 'CONTAINER'
+KEY_RDSR_VALUE_TYPE_NUM = 'NUM'
+KEY_RDSR_VALUE_TYPE_TEXT = 'TEXT'
+KEY_RDSR_VALUE_TYPE_UIDREF = 'UIDREF'
+
 KEY_NORMALIZATION_DETECTOR_SIDE_LENGTH = 'detector_side_length'
 KEY_NORMALIZATION_FIELD_SIZE_MODE = 'field_size_mode'
 KEY_NORMALIZATION_MANUFACTURER = 'manufacturer'
@@ -141,8 +150,19 @@ PLOT_SLIDER_PADDING = dict(b=0, t=0, l=25, r=25)
 PLOT_SLIDER_PADDING_NOTEBOOK = dict(b=0, t=0, l=20, r=20)
 
 PLOT_WIREFRAME_LINE_WIDTH = 4
+
+# Support pad and wireframes are hidden in plot_setup/plot_event until
+# toggled on with the plot menu buttons below.
+PLOT_OPTIONAL_TRACE_VISIBILITY = 'legendonly'
+PLOT_OPTIONAL_TRACE_BUTTON_LABEL_SHOW = 'Show pad and wireframes'
+PLOT_OPTIONAL_TRACE_BUTTON_LABEL_HIDE = 'Hide pad and wireframes'
+
 PLOT_DRAGMODE = 'orbit'
 
+# Constant ui revision, keeps user changes such as camera view when a plot
+# is re-rendered with new data
+PLOT_UIREVISION = 'pyskindose'
+
 PLOT_ASPECTMODE_SETUP_AND_EVENT = 'data'
 PLOT_ASPECTMODE_PLOT_DOSEMAP = 'data'
 
@@ -153,6 +173,16 @@ PLOT_PROCEDURE_AXIS_RANGE_X = [-300, 300]
 PLOT_PROCEDURE_AXIS_RANGE_Y = [-300, 300]
 PLOT_PROCEDURE_AXIS_RANGE_Z = [-300, 300]
 
+# Maximum size in bytes of the positioned phantom vertices kept between
+# plot_procedure calls
+PLOT_PROCEDURE_CACHE_MAX_BYTES = 64 * 2 ** 20
+
+# Decimals (in cm) kept for vertex coordinates in plot_procedure event frames
+PLOT_PROCEDURE_COORDINATE_DECIMALS = 3
+
+# Maximum number of irradiation events shown in the plot_procedure slider
+PLOT_PROCEDURE_MAX_SLIDER_EVENTS = 500
+
 # shift size of the entire image to the left to remove whitespace in plot
 PLOT_GROUND_SHIFT_X_STATIC = 50
 
@@ -165,11 +195,23 @@ PLOT_BASE_SIZE_STATIC = 297
 
 PLOT_SOURCE_SIZE = 8
 PLOT_FILE_TYPE_STATIC = '.png'
+PLOT_FILE_TYPE_FRAME = '.jpeg'
+
+# Output formats of geometry plots: an interactive plot, or one static image
+# per animation frame (i.e. per irradiation event in plot_procedure)
+PLOT_OUTPUT_FORMAT_HTML = 'html'
+PLOT_OUTPUT_FORMAT_JPEG_FRAMES = 'jpeg_frames'
 
 PLOT_LIGHTNING_DIFFUSE = 0.5
 PLOT_LIGHTNING_AMBIENT = 0.5
 
 PLOT_SLIDER_TRANSITION = dict(duration=300, easing="quad-in-out")
+# Animation settings for switching between irradiation event frames. 3D
+# traces can not be transitioned, so each frame is redrawn immediately.
+PLOT_EVENT_FRAME_ANIMATION = dict(
+    mode="immediate",
+    frame=dict(duration=0, redraw=True),
+    transition=dict(duration=0))
 
 PLOT_ZERO_LINE_WIDTH = 5
 
@@ -27,22 +27,26 @@ def calculate_field_size(field_size_mode, data_parsed, data_norm):
         IF field_size_mode = 'ASD', the function calculates the field size
         by distance scaling the actual shutter distance to the detector plane
 
-    data_parsed : [type]
-        [description]
-    data_norm : [type]
-        [description]
+    data_parsed : pd.DataFrame
+        Parsed RDSR data from all irradiation events in the RDSR input file,
+        i.e. output of function rdsr_parser
+    data_norm : Dict[str, Any]
+        Normalized columns of the irradiation events collected so far, e.g.
+        DSD and DSI in cm, as arrays.
 
     Returns
     -------
-    [type]
-        [description]
+    Tuple[np.ndarray, np.ndarray]
+        Field side length in lateral and longitudinal direction at the image
+        receptor plane, in cm, one element per irradiation event.
 
     """
     # if collimated field are mode, set FS_lat = FS_long =
     # sqrt(collimate field area). NOTE: This should only be used when actual
     # shutter distances are unavailable.
     if field_size_mode == 'CFA':
-        FS_lat = round(100 * np.sqrt(data_parsed.CollimatedFieldArea_m2), 3)
+        FS_lat = np.round(100 * np.sqrt(
+            data_parsed.CollimatedFieldArea_m2.to_numpy(dtype=np.float64)), 3)
         FS_long = FS_lat
 
     return FS_lat, FS_long
@@ -216,27 +220,48 @@ def fetch_and_append_hvl(data_norm: pd.DataFrame) -> pd.DataFrame:
         model, kVp, and copper- and aluminum filtration to the normalized RDSR
         data in data_norm and returns the DataFrame with the HVL info appended.
 
+    Raises
+    ------
+    ValueError
+        If the HVL table has no, or more than one, HVL for the device model,
+        kVp and copper filtration of an irradiation event.
+
     """
     # Open connection to database
     conn = db_connect()[0]
 
     # Fetch entire HVL table
-    hvl_data = pd.read_sql_query("SELECT * FROM HVL_simulated", conn)
-
-    hvl = [float(hvl_data.loc[
-        (hvl_data['DeviceModel'] == data_norm.model[event]) &
-        (hvl_data['kVp_kV'] == round(data_norm.kVp[event])) &
-        (hvl_data['AddedFiltration_mmCu'] ==
-         data_norm.filter_thickness_Cu[event]), "HVL_mmAl"])
-           for event in range(len(data_norm))]
+    try:
+        hvl_data = pd.read_sql_query("SELECT * FROM HVL_simulated", conn)
+    finally:
+        # close database connection
+        conn.close()
+
+    # Index the HVL table by device model, kVp and copper filtration. Keys
+    # that occur more than once do not give a unique HVL, and are left out.
+    hvl_keys = ["DeviceModel", "kVp_kV", "AddedFiltration_mmCu"]
+    hvl_table = hvl_data.drop_duplicates(subset=hvl_keys, keep=False)\
+        .set_index(hvl_keys)["HVL_mmAl"]
+
+    # Look up the HVL of all events at once, rather than masking the entire
+    # HVL table once per event
+    event_keys = pd.MultiIndex.from_arrays([
+        np.asarray(data_norm.model, dtype=object),
+        np.round(data_norm.kVp.to_numpy(dtype=np.float64)).astype(np.int64),
+        data_norm.filter_thickness_Cu.to_numpy(dtype=np.float64)],
+        names=hvl_keys)
+
+    hvl = hvl_table.reindex(event_keys).to_numpy(dtype=np.float64)
+
+    missing = np.flatnonzero(np.isnan(hvl))
+    if missing.size:
+        raise ValueError(
+            f"No unique HVL found in HVL_simulated for irradiation events "
+            f"{missing.tolist()}")
 
     # Append HVL data to data_norm
     data_norm["HVL"] = hvl
 
-    # close database connection
-    conn.commit()
-    conn.close()
-
     return data_norm
 
 
@@ -298,6 +323,10 @@ class Triangle:
         Vector from p to second vertex
     n: np.array
         normal vector to the triangle, pointing upwards (negative y direction).
+    p1_p1, p1_p2, p2_p2: float
+        Dot products of p1 and p2, used in check_intersection.
+    d: float
+        Denominator of the triangle coordinates in check_intersection.
 
     Methods
     -------
@@ -320,6 +349,13 @@ class Triangle:
         n = np.cross(self.p1, self.p2)
         self.n = n/np.sqrt(n.dot(n))
 
+        # These only depend on the triangle, and are computed once here rather
+        # than for each segment check in check_intersection.
+        self.p1_p1 = np.dot(self.p1, self.p1)
+        self.p1_p2 = np.dot(self.p1, self.p2)
+        self.p2_p2 = np.dot(self.p2, self.p2)
+        self.d = np.square(self.p1_p2) - self.p1_p1 * self.p2_p2
+
     def check_intersection(self, start: np.array,
                            stop: np.array) -> List[bool]:
         """Check if a 3D segment intercepts with the triangle.
@@ -351,8 +387,8 @@ class Triangle:
         w = self.p - start
 
         # List of unit vectors from start, to each of the coordinates in stop.
-        v = ((stop - start).T /
-             np.linalg.norm(stop - start, axis=stop.ndim-1)).T
+        v = stop - start
+        v = (v.T / np.linalg.norm(v, axis=stop.ndim-1)).T
 
         # Distances from start to the plane of the triangle, in the direction
         # along the vector v.
@@ -363,22 +399,19 @@ class Triangle:
         # Vector from central vertex p to i
         p_i = i - self.p
 
-        d = np.square(
-            np.dot(self.p1, self.p2)) - np.dot(self.p1, self.p1) * \
-            np.dot(self.p2, self.p2)
+        p_i_p1 = np.dot(p_i, self.p1)
+        p_i_p2 = np.dot(p_i, self.p2)
 
-        d1 = (np.dot(self.p1, self.p2) * np.dot(p_i, self.p2) -
-              np.dot(self.p2, self.p2) * np.dot(p_i, self.p1)) / d
+        d1 = (self.p1_p2 * p_i_p2 - self.p2_p2 * p_i_p1) / self.d
 
-        d2 = (np.dot(self.p1, self.p2) * np.dot(p_i, self.p1) -
-              np.dot(self.p1, self.p1) * np.dot(p_i, self.p2)) / d
+        d2 = (self.p1_p2 * p_i_p1 - self.p1_p1 * p_i_p2) / self.d
 
         # Now we have p_i = d1/d * p1 + d2/d * p2, thus,
         # if 0 <= d1/d <= 1, and 0 <= d2/d <= 1, and d1 + d2 <= 1, the beam
         # intercepts the triangle.
-        hits = np.array([d1 >= 0, d1 <= 1,
-                         d2 >= 0, d2 <= 1,
-                         d1 + d2 <= 1]).all(axis=0)
+        # The conditions are combined element-wise, rather than by stacking
+        # them into a 5*n array first.
+        hits = (d1 >= 0) & (d1 <= 1) & (d2 >= 0) & (d2 <= 1) & (d1 + d2 <= 1)
 
         return hits.tolist()
 
@@ -4,11 +4,10 @@ import os
 from typing import Union, Optional
 
 import pandas as pd
-import pydicom
 
 from pyskindose.analyze_data import analyze_data
 from pyskindose.dev_data import DEVELOPMENT_PARAMETERS
-from pyskindose.rdsr_parser import rdsr_parser
+from pyskindose.rdsr_parser import load_rdsr, rdsr_parser
 from pyskindose.rdsr_normalizer import rdsr_normalizer
 from pyskindose.settings_pyskindose import PyskindoseSettings
 
@@ -90,7 +89,7 @@ def _read_and_normalise_rdsr_data(
         return pd.read_json(rdsr_filepath)
 
     # else load RDSR data with pydicom
-    data_raw = pydicom.read_file(rdsr_filepath)
+    data_raw = load_rdsr(rdsr_filepath)
 
     # parse RDSR data from raw .dicom file
     data_parsed = rdsr_parser(data_raw)
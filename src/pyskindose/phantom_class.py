@@ -371,37 +371,111 @@ class Phantom:
             Irradiation event index
 
         """
-        self.r = copy.copy(self.r_ref)
+        # Scalar lookups, rather than a column Series per parameter
+        R = _create_table_rotation_matrix(
+            rot=np.deg2rad(data_norm.at[event, 'At1']),
+            tilt=np.deg2rad(data_norm.at[event, 'At2']),
+            cradle=np.deg2rad(data_norm.at[event, 'At3']))
 
-        # position phantom centered about isocenter
-        self.r[:, 2] += self.table_length / 2
+        t = np.array([data_norm.at[event, 'Tx'],
+                      data_norm.at[event, 'Ty'],
+                      data_norm.at[event, 'Tz']])
 
-        # Fetch At1, At2, and At3
-        rot = np.deg2rad(data_norm['At1'][event])
-        tilt = np.deg2rad(data_norm['At2'][event])
-        cradle = np.deg2rad(data_norm['At3'][event])
+        self.r = _transform_vertices(
+            r=self.r_ref, R=R, center=self._fetch_table_center(), t=t)
 
-        R1 = np.array([[+np.cos(rot),   0,  +np.sin(rot)],
-                      [0,              1,   0],
-                      [-np.sin(rot), 0, +np.cos(rot)]])
+    def position_all(self, data_norm: pd.DataFrame) -> np.ndarray:
+        """Position the phantom for all irradiation events at once.
 
-        R2 = np.array([[+1, +0, +0],
-                       [+0, +np.cos(tilt), -np.sin(tilt)],
-                       [+0, +np.sin(tilt), +np.cos(tilt)]])
+        Vectorized counterpart to position, for when the phantom is needed in
+        the position of many events, e.g. in plot_procedure. The phantom
+        itself is not moved.
 
-        R3 = np.array([[+np.cos(cradle), -np.sin(cradle), 0],
-                       [+np.sin(cradle), +np.cos(cradle), +0],
-                       [+0, +0, +1]])
+        Parameters
+        ----------
+        data_norm : pd.DataFrame
+            Table containing dicom RDSR information from each irradiation event
+            See rdsr_normalizer.py for more information.
 
-        # Apply table rotation
-        self.r = np.matmul(np.matmul(R3, np.matmul(R2, R1)), (self.r).T).T
+        Returns
+        -------
+        np.ndarray
+            N*V*3 array with the xyz coordinates of the V phantom vertices in
+            each of the N irradiation events in data_norm.
+
+        """
+        rot, tilt, cradle = np.deg2rad(
+            data_norm[['At1', 'At2', 'At3']].to_numpy(dtype=float).T)
 
-        # Replace phantom to stanting position
-        self.r[:, 2] -= self.table_length/2
+        R = _create_table_rotation_matrix(rot=rot, tilt=tilt, cradle=cradle)
 
-        # Apply phantom translation
-        t = np.array(
-            [data_norm.Tx[event], data_norm.Ty[event], data_norm.Tz[event]]
-            )
+        t = data_norm[['Tx', 'Ty', 'Tz']].to_numpy(dtype=float)
 
-        self.r = self.r + t
+        return _transform_vertices(
+            r=self.r_ref, R=R, center=self._fetch_table_center(), t=t)
+
+    def _fetch_table_center(self) -> np.ndarray:
+        """Fetch the point about which the table rotations are applied."""
+        return np.array([0, 0, self.table_length / 2])
+
+
+def _create_table_rotation_matrix(rot, tilt, cradle) -> np.ndarray:
+    """Create the rotation matrix of the table angles At1, At2 and At3.
+
+    Parameters
+    ----------
+    rot, tilt, cradle
+        Table rotation, tilt and cradle angles (At1, At2 and At3) in radians.
+        Either scalars for a single irradiation event, or arrays with one
+        angle per event.
+
+    Returns
+    -------
+    np.ndarray
+        3*3 rotation matrix, or N*3*3 matrices for N events.
+
+    """
+    zeros = np.zeros_like(rot)
+    ones = np.ones_like(rot)
+
+    R1 = np.array([[+np.cos(rot), zeros, +np.sin(rot)],
+                   [zeros, ones, zeros],
+                   [-np.sin(rot), zeros, +np.cos(rot)]])
+
+    R2 = np.array([[ones, zeros, zeros],
+                   [zeros, +np.cos(tilt), -np.sin(tilt)],
+                   [zeros, +np.sin(tilt), +np.cos(tilt)]])
+
+    R3 = np.array([[+np.cos(cradle), -np.sin(cradle), zeros],
+                   [+np.sin(cradle), +np.cos(cradle), zeros],
+                   [zeros, zeros, ones]])
+
+    # Move any event axis first, i.e. one 3*3 matrix per event
+    R1, R2, R3 = (np.moveaxis(R, (0, 1), (-2, -1)) for R in (R1, R2, R3))
+
+    return np.matmul(R3, np.matmul(R2, R1))
+
+
+def _transform_vertices(r: np.ndarray, R: np.ndarray, center: np.ndarray,
+                        t: np.ndarray) -> np.ndarray:
+    """Rotate vertices about a center point, then translate them.
+
+    Parameters
+    ----------
+    r : np.ndarray
+        V*3 array with the xyz coordinates of the vertices
+    R : np.ndarray
+        3*3 rotation matrix, or N*3*3 rotation matrices for N events
+    center : np.ndarray
+        xyz coordinates of the rotation center
+    t : np.ndarray
+        xyz translation, or N*3 translations for N events
+
+    Returns
+    -------
+    np.ndarray
+        V*3 array with the transformed vertices, or N*V*3 for N events.
+
+    """
+    return np.matmul(r + center, np.swapaxes(R, -1, -2)) \
+        - center + t[..., np.newaxis, :]
@@ -30,6 +30,7 @@ from ..constants import (
     PLOT_ORDER_STATIC
 )
 
+from .create_mesh3d import _split_columns
 from .plot_settings import (
     fetch_plot_colors,
     fetch_plot_margin,
@@ -107,11 +108,13 @@ def create_dose_map_plot(
     hover_text = [lat_text[cell] + lon_text[cell] + ver_text[cell] +
                   dose_text[cell] for cell in range(len(patient.r))]
 
+    x, y, z = _split_columns(patient.r)
+    i, j, k = _split_columns(patient.ijk)
+
     # create mesh object for the phantom
     phantom_mesh = [
         go.Mesh3d(
-            x=patient.r[:, 0], y=patient.r[:, 1], z=patient.r[:, 2],
-            i=patient.ijk[:, 0], j=patient.ijk[:, 1], k=patient.ijk[:, 2],
+            x=x, y=y, z=z, i=i, j=j, k=k,
             intensity=patient.dose, colorscale=DOSEMAP_COLORSCALE,
             showscale=True,
             hoverinfo='text',
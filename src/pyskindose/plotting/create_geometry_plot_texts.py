@@ -30,29 +30,43 @@ def create_geometry_plot_texts(beam: Beam, table: Phantom, pad: Phantom,
         phantom_model "plane", "cylinder" or "human"
     """
     logger.debug("Creating geometry plot (and hover) texts")
-    source_text = [
-        f"<b>X-ray source</b><br><br><b>LAT: </b>{np.around(beam.r[0, 2])} cm<br><b>LON: </b>{np.around(beam.r[0, 0])} cm<br><b>VER: </b>{np.around(beam.r[0, 1])} cm"]
+    source_text = _create_vertex_texts(name="X-ray source", r=beam.r[:1])
 
-    beam_text = [
-        f"<b>X-ray beam vertex</b><br><br><b>LAT: </b>{np.around(beam.r[ind, 2])} cm<br><b>LON: </b>{np.around(beam.r[ind, 0])} cm<br><b>VER: </b>{np.around(beam.r[ind, 1])} cm"
-        for ind in range(len(beam.r))]
+    beam_text = _create_vertex_texts(name="X-ray beam vertex", r=beam.r)
 
-    detectors_text = [
-        f"<b>X-ray detector</b><br><br><b>LAT: </b>{np.around(beam.det_r[ind, 2])} cm<br><b>LON: </b>{np.around(beam.det_r[ind, 0])} cm<br><b>VER: </b>{np.around(beam.det_r[ind, 1])} cm"
-        for ind in range(len(beam.det_r))]
+    detectors_text = _create_vertex_texts(name="X-ray detector", r=beam.det_r)
 
-    table_text = [
-        f"<b>Support table</b><br><br><b>LAT: </b>{np.around(table.r[ind, 2])} cm<br><b>LON: </b>{np.around(table.r[ind, 0])} cm<br><b>VER: </b>{np.around(table.r[ind, 1])} cm"
-        for ind in range(len(table.r))]
+    table_text = _create_vertex_texts(name="Support table", r=table.r)
 
-    pad_text = [
-        f"<b>Support pad</b><br><br><b>LAT: </b>{np.around(pad.r[ind, 2])} cm<br><b>LON: </b>{np.around(pad.r[ind, 0])} cm<br><b>VER: </b>{np.around(pad.r[ind, 1])} cm"
-        for ind in range(len(pad.r))]
+    pad_text = _create_vertex_texts(name="Support pad", r=pad.r)
 
     patient_text = None
     if patient is not None:
-        patient_text = [
-            f"<b>Patient phantom</b><br><br><b>LAT: </b>{np.around(patient.r[ind, 2])} cm<br><b>LON: </b>{np.around(patient.r[ind, 0])} cm<br><b>VER: </b>{np.around(patient.r[ind, 1])} cm"
-            for ind in range(len(patient.r))]
+        patient_text = _create_vertex_texts(name="Patient phantom", r=patient.r)
 
     return source_text, beam_text, detectors_text, table_text, pad_text, patient_text
+
+
+def _create_vertex_texts(name: str, r: np.ndarray) -> List[str]:
+    """Create one hover text per vertex of a geometry object.
+
+    The coordinates are rounded in a single array operation, rather than
+    once per vertex and axis, since this is the dominant cost when plotting
+    large phantoms for many irradiation events.
+
+    Parameters
+    ----------
+    name : str
+        Name of the object, shown in bold at the top of each text
+    r : np.ndarray
+        n*3 array with the xyz coordinates of the object vertices
+
+    Returns
+    -------
+    List[str]
+        Hover text for each of the n vertices
+
+    """
+    return [
+        f"<b>{name}</b><br><br><b>LAT: </b>{z} cm<br><b>LON: </b>{x} cm<br><b>VER: </b>{y} cm"
+        for x, y, z in np.around(r).tolist()]
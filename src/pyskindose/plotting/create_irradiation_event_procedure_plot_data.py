@@ -1,13 +1,15 @@
 import logging
-from typing import Dict, Optional, Union
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
 from ..beam_class import Beam
-from .create_geometry_plot_texts import create_geometry_plot_texts
-from .create_mesh3d import create_mesh_3d_general
+from .create_geometry_plot_texts import (
+    create_geometry_plot_texts, _create_vertex_texts)
+from .create_mesh3d import _split_columns, create_mesh_3d_general
 from .create_wireframes import create_wireframes
 from ..constants import (
     COLOR_BEAM,
@@ -17,6 +19,7 @@ from ..constants import (
     COLOR_SOURCE,
     COLOR_TABLE,
     MESH_OPACITY_BEAM,
+    PHANTOM_MODEL_HUMAN,
     IRRADIATION_EVENT_PROCEDURE_KEY_BEAM,
     IRRADIATION_EVENT_PROCEDURE_KEY_DETECTORS,
     IRRADIATION_EVENT_PROCEDURE_KEY_PAD,
@@ -40,27 +43,74 @@ def create_irradiation_event_procedure_plot_data(
     event: int,
     table: Phantom,
     pad: Phantom,
-    patient: Optional[Phantom] = None
+    patient: Optional[Phantom] = None,
+    phantom_positions: Optional[
+        Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]] = None,
+    beam: Optional[Beam] = None
     ) -> Dict[str, Union[go.Scatter3d, go.Mesh3d]]:
-    
+    """Create the plot data of a single irradiation event in plot_procedure.
+
+    Parameters
+    ----------
+    data_norm : pd.DataFrame
+        RDSR data, normalized for compliance with PySkinDose.
+    include_patient : bool
+        Choose if the patient phantom should be included
+    visible_status : bool
+        Set the initial visibility of the plot data
+    event : int
+        Irradiation event index
+    table : Phantom
+        Patient support table phantom
+    pad : Phantom
+        Patient support pad phantom
+    patient : Optional[Phantom], optional
+        patient phantom, by default None
+    phantom_positions : Optional[Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]], optional
+        Table, pad and patient vertices already positioned for the event,
+        e.g. by Phantom.position_all. The phantoms are positioned from
+        data_norm if not given.
+    beam : Optional[Beam], optional
+        Beam to reposition for the event, e.g. the beam of the previous
+        event. A new Beam is created if not given.
+
+    """
     # Position geometry objects
-    beam = Beam(data_norm, event=event, plot_setup=False)
-    table.position(data_norm, event)
-    pad.position(data_norm, event)
+    if beam is None:
+        beam = Beam(data_norm, event=event, plot_setup=False)
+    else:
+        beam.reposition(data_norm, event=event, plot_setup=False)
+
+    # Position all phantoms before creating the hover texts, which show the
+    # positions in this event
+    if phantom_positions is None:
+        table.position(data_norm, event)
+        pad.position(data_norm, event)
+        if include_patient:
+            patient.position(data_norm, event)
+    else:
+        table.r, pad.r, patient_r = phantom_positions
+        if include_patient:
+            patient.r = patient_r
 
     source_text, beam_text, detectors_text, table_text, pad_text, patient_text = create_geometry_plot_texts(
-        beam=beam, table=table, pad=pad, patient=patient
+        beam=beam, table=table, pad=pad,
+        patient=(patient if include_patient
+                 and patient.phantom_model != PHANTOM_MODEL_HUMAN else None)
     )
 
     output = {}
 
     if include_patient:
-        patient.position(data_norm, event)
-
         # Create patient mesh
-        output[IRRADIATION_EVENT_PROCEDURE_KEY_PATIENT] = create_mesh_3d_general(
-            obj=patient, color=COLOR_PATIENT, mesh_text=patient_text,
-            lighting=dict(diffuse=0.5, ambient=0.5), visible_status=visible_status)
+        if patient.phantom_model == PHANTOM_MODEL_HUMAN:
+            output[IRRADIATION_EVENT_PROCEDURE_KEY_PATIENT] = \
+                _create_merged_human_patient_mesh(
+                    patient=patient, visible_status=visible_status)
+        else:
+            output[IRRADIATION_EVENT_PROCEDURE_KEY_PATIENT] = create_mesh_3d_general(
+                obj=patient, color=COLOR_PATIENT, mesh_text=patient_text,
+                lighting=dict(diffuse=0.5, ambient=0.5), visible_status=visible_status)
 
     # Create X-ray source mesh
     output[IRRADIATION_EVENT_PROCEDURE_KEY_SOURCE] = go.Scatter3d(
@@ -102,3 +152,90 @@ def create_irradiation_event_procedure_plot_data(
         beam=beam, table=table, pad=pad, line_width=4, visible=visible_status)
 
     return output
+
+
+def _create_merged_human_patient_mesh(
+        patient: Phantom, visible_status: bool) -> go.Mesh3d:
+    """Create a human patient mesh with duplicate vertices merged.
+
+    Human phantoms are loaded from .stl files, which store three separate
+    vertices for every triangle. Merging the vertices that triangles share
+    gives the same surface with about a sixth of the vertices, and thus of
+    the hover texts, for each irradiation event in plot_procedure.
+
+    Parameters
+    ----------
+    patient : Phantom
+        Human patient phantom from instance of class Phantom, positioned
+        for the irradiation event.
+    visible_status : bool
+        Set the initial visibility of the mesh.
+
+    """
+    # The duplicates are found in the reference position, so that the merged
+    # vertices and triangles are the same in every irradiation event, even
+    # if positioning leaves duplicates a rounding error apart.
+    r_ref = np.ascontiguousarray(patient.r_ref, dtype=np.float64)
+    ijk = np.ascontiguousarray(patient.ijk)
+
+    vertex_index, ijk = _merge_duplicate_vertices(
+        r_ref=r_ref.tobytes(), ijk=ijk.tobytes(), ijk_dtype=ijk.dtype.str)
+
+    r = patient.r[vertex_index]
+
+    # Shared vertices would otherwise get smoothed normals, flat shading
+    # keeps the faceted look of the unmerged mesh.
+    x, y, z = _split_columns(r)
+    i, j, k = _split_columns(ijk)
+
+    return go.Mesh3d(
+        x=x, y=y, z=z, i=i, j=j, k=k,
+        color=COLOR_PATIENT, hoverinfo="text",
+        text=_create_vertex_texts(name="Patient phantom", r=r),
+        opacity=1.0, flatshading=True,
+        lighting=dict(diffuse=0.5, ambient=0.5),
+        visible=visible_status)
+
+
+@lru_cache(maxsize=4)
+def _merge_duplicate_vertices(
+        r_ref: bytes, ijk: bytes, ijk_dtype: str
+        ) -> Tuple[np.ndarray, np.ndarray]:
+    """Merge the duplicate vertices of a mesh in its reference position.
+
+    The mesh is passed as bytes, so that the merge is cached and only done
+    once per phantom rather than once per irradiation event. Do not modify
+    the returned arrays.
+
+    Parameters
+    ----------
+    r_ref : bytes
+        Bytes of the float64 V*3 array of reference vertex coordinates,
+        Phantom.r_ref.
+    ijk : bytes
+        Bytes of the T*3 array of triangle vertex indices, Phantom.ijk.
+    ijk_dtype : str
+        dtype of ijk.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Index of each merged vertex in r_ref, in order of first appearance,
+        and the T*3 triangle indices into the merged vertices.
+
+    """
+    r_ref = np.frombuffer(r_ref, dtype=np.float64).reshape(-1, 3)
+    ijk = np.frombuffer(ijk, dtype=ijk_dtype).reshape(-1, 3)
+
+    _, first_index, inverse = np.unique(
+        r_ref, axis=0, return_index=True, return_inverse=True)
+
+    # Keep the merged vertices in order of first appearance
+    order = np.argsort(first_index)
+    vertex_index = first_index[order]
+    merged_ijk = np.argsort(order)[inverse.reshape(-1)][ijk]
+
+    vertex_index.setflags(write=False)
+    merged_ijk.setflags(write=False)
+
+    return vertex_index, merged_ijk
@@ -21,6 +21,14 @@ def create_layout_for_dose_map_plots(
     COLOR_CANVAS,
 ):
 
+    # All axes are hidden in dose map plots
+    axis_settings = dict(
+        title='',
+        backgroundcolor=COLOR_CANVAS,
+        showgrid=False,
+        zeroline=False,
+        showticklabels=False)
+
     layout = go.Layout(
         height=PLOT_HEIGHT,
         width=PLOT_WIDTH,
@@ -45,29 +53,9 @@ def create_layout_for_dose_map_plots(
 
         scene=dict(
             aspectmode=PLOT_ASPECTMODE_PLOT_DOSEMAP,
-            xaxis=dict(
-                title='',
-                backgroundcolor=COLOR_CANVAS,
-                showgrid=False,
-                zeroline=False,
-                showticklabels=False,
-                ),
-
-            yaxis=dict(
-                title='',
-                backgroundcolor=COLOR_CANVAS,
-                showgrid=False,
-                zeroline=False,
-                showticklabels=False,
-                ),
-
-            zaxis=dict(
-                title='',
-                backgroundcolor=COLOR_CANVAS,
-                showgrid=False,
-                zeroline=False,
-                showticklabels=False,
-                ),
+            xaxis=axis_settings,
+            yaxis=axis_settings,
+            zaxis=axis_settings,
                 )
         )
 
@@ -1,5 +1,6 @@
-from typing import Dict, Optional, Union, List
+from typing import Dict, Optional, Union, List, Tuple
 
+import numpy as np
 import plotly.graph_objects as go
 
 from ..beam_class import Beam
@@ -7,6 +8,29 @@ from .get_visual_offset import _get_visual_offset
 from ..phantom_class import Phantom
 
 
+def _split_columns(a: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split an n*3 array into its three columns as contiguous arrays.
+
+    Slicing a column of an n*3 array gives a strided view, which plotly
+    copies when serializing the trace. Transposing once to a 3*n array
+    makes each row, and hence each returned column, a contiguous view.
+
+    Parameters
+    ----------
+    a : np.ndarray
+        n*3 array, e.g. vertex coordinates r or triangle indices ijk.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        The first, second and third column of a.
+
+    """
+    first, second, third = np.ascontiguousarray(a.T)
+
+    return first, second, third
+
+
 def create_mesh_3d_general(
         obj: Union[Phantom, Beam],
         color: str,
@@ -15,27 +39,18 @@ def create_mesh_3d_general(
         mesh_name: Optional[str] = None,
         lighting: Optional[Dict] = None,
         detector_mesh: bool = False,
-        visible_status: Optional[bool] = True) -> go.Mesh3d:
+        visible_status: Optional[Union[bool, str]] = True) -> go.Mesh3d:
 
     if opacity is None:
         opacity = 1.0
 
     visual_offset = _get_visual_offset(patient=obj)
 
-    mesh_x = obj.r[:, 0]
-    mesh_y = obj.r[:, 1] + visual_offset
-    mesh_z = obj.r[:, 2]
-    mesh_i = obj.ijk[:, 0]
-    mesh_j = obj.ijk[:, 1]
-    mesh_k = obj.ijk[:, 2]
-
-    if detector_mesh:
-        mesh_x = obj.det_r[:, 0]
-        mesh_y = obj.det_r[:, 1] + visual_offset
-        mesh_z = obj.det_r[:, 2]
-        mesh_i = obj.det_ijk[:, 0]
-        mesh_j = obj.det_ijk[:, 1]
-        mesh_k = obj.det_ijk[:, 2]
+    r, ijk = (obj.det_r, obj.det_ijk) if detector_mesh else (obj.r, obj.ijk)
+
+    mesh_x, mesh_y, mesh_z = _split_columns(r)
+    mesh_y = mesh_y + visual_offset
+    mesh_i, mesh_j, mesh_k = _split_columns(ijk)
 
     if lighting is None and mesh_name is None:
         return go.Mesh3d(
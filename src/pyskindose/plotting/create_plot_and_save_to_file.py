@@ -1,22 +1,81 @@
 import logging
-from typing import List, Union
+import os
+from typing import Any, Dict, List, Optional, Union
 import plotly.graph_objects as go
 
+from ..constants import (
+    PLOT_FILE_TYPE_FRAME,
+    PLOT_OUTPUT_FORMAT_HTML,
+    PLOT_OUTPUT_FORMAT_JPEG_FRAMES,
+)
+
 logger = logging.getLogger(__name__)
 
 
-def create_plot_and_save_to_file(mode: str, data: List[Union[go.Mesh3d, go.Scatter3d]], layout: go.Layout):
+def create_plot_and_save_to_file(mode: str, data: List[Union[go.Mesh3d, go.Scatter3d]],
+                                 layout: Union[go.Layout, Dict[str, Any]],
+                                 frames: Optional[List[go.Frame]] = None,
+                                 output_format: str = PLOT_OUTPUT_FORMAT_HTML,
+                                 output_dir: Optional[str] = None):
     """
 
     :param mode:
     :param data:
     :param layout:
+    :param frames: optional animation frames, e.g. one per irradiation event
+    :param output_format: "html" shows the interactive plot, "jpeg_frames"
+        saves one static image per animation frame instead
+    :param output_dir: directory of the "jpeg_frames" images, by default the
+        current working directory
     :return:
     """
+    if output_format not in [PLOT_OUTPUT_FORMAT_HTML,
+                             PLOT_OUTPUT_FORMAT_JPEG_FRAMES]:
+        raise ValueError(f"Unknown plot output format: {output_format}")
+
+    if output_format == PLOT_OUTPUT_FORMAT_JPEG_FRAMES and not frames:
+        raise ValueError(
+            f"Plot output format {output_format} requires animation frames")
+
     plot_filename = f"{mode}.html"
 
     logger.debug(f"Creating plot and savint to file {plot_filename}")
 
-    fig = go.Figure(data=data, layout=layout)
+    fig = go.Figure(data=data, layout=layout, frames=frames)
+
+    if output_format == PLOT_OUTPUT_FORMAT_JPEG_FRAMES:
+        _save_frame_images(fig=fig, mode=mode, output_dir=output_dir)
+        return
 
     fig.show()
+
+
+def _save_frame_images(fig: go.Figure, mode: str,
+                       output_dir: Optional[str] = None) -> None:
+    """Save one static image per animation frame of a figure.
+
+    The images are rendered with kaleido, which avoids building the
+    interactive plot in a browser, e.g. when creating reports in batch.
+    The files are named after the mode and the frame name, e.g.
+    plot_procedure_0.jpeg for the first irradiation event.
+
+    :param fig: figure with animation frames
+    :param mode: plot mode, used as file name prefix
+    :param output_dir: directory of the images, created if it does not
+        exist. By default the current working directory.
+    """
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    # The slider can not be operated in a static image
+    fig.update_layout(sliders=[])
+
+    for frame in fig.frames:
+        fig.update(data=frame.data)
+
+        image_filename = os.path.join(
+            output_dir or "", f"{mode}_{frame.name}{PLOT_FILE_TYPE_FRAME}")
+
+        logger.debug(f"Saving frame {frame.name} to file {image_filename}")
+
+        fig.write_image(image_filename)
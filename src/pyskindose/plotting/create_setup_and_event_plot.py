@@ -1,6 +1,7 @@
 import logging
-from typing import List
+from typing import Any, Dict, List
 from .plot_settings import (
+    fetch_axis_settings,
     fetch_plot_colors,
     fetch_plot_size,
     fetch_plot_margin)
@@ -28,11 +29,13 @@ from ..constants import (
     PLOT_HOVERLABEL_FONT_SIZE,
     PLOT_LIGHTNING_DIFFUSE,
     PLOT_LIGHTNING_AMBIENT,
+    PLOT_OPTIONAL_TRACE_BUTTON_LABEL_HIDE,
+    PLOT_OPTIONAL_TRACE_BUTTON_LABEL_SHOW,
+    PLOT_OPTIONAL_TRACE_VISIBILITY,
     PLOT_SOURCE_SIZE,
     PLOT_TITLE_FONT_FAMILY,
     PLOT_TITLE_FONT_SIZE,
     PLOT_WIREFRAME_LINE_WIDTH,
-    PLOT_ZERO_LINE_WIDTH,
 )
 
 from .create_mesh3d import create_mesh_3d_general
@@ -65,6 +68,8 @@ def create_setup_and_event_plot(
     COLOR_CANVAS, COLOR_PLOT_TEXT, COLOR_GRID, COLOR_ZERO_LINE = \
         fetch_plot_colors(dark_mode=dark_mode)
 
+    AXIS_SETTINGS = fetch_axis_settings(dark_mode=dark_mode)
+
     PLOT_WIDTH, PLOT_HEIGHT = fetch_plot_size(
         notebook_mode=notebook_mode)
 
@@ -109,7 +114,8 @@ def create_setup_and_event_plot(
         obj=pad,
         color=COLOR_PAD,
         mesh_text=pad_text,
-        mesh_name=MESH_NAME_PAD)
+        mesh_name=MESH_NAME_PAD,
+        visible_status=PLOT_OPTIONAL_TRACE_VISIBILITY)
 
     beam_mesh = create_mesh_3d_general(
         obj=beam,
@@ -123,7 +129,13 @@ def create_setup_and_event_plot(
         table=table,
         pad=pad,
         line_width=PLOT_WIREFRAME_LINE_WIDTH,
-        visible=True)
+        visible=PLOT_OPTIONAL_TRACE_VISIBILITY)
+
+    # The pad and wireframes are left out of the first render and are only
+    # drawn once toggled on from the plot menu.
+    initial_data = [patient_mesh, source_mesh, table_mesh, detector_mesh,
+                    beam_mesh]
+    optional_data = [pad_mesh, wf_beam, wf_table, wf_pad, wf_detector]
 
     logger.debug("Setting up plot layout settings")
     layout = go.Layout(
@@ -161,35 +173,55 @@ def create_setup_and_event_plot(
 
         dragmode=PLOT_DRAGMODE,
 
+        updatemenus=_create_optional_trace_menu(
+            trace_indices=list(range(
+                len(initial_data), len(initial_data) + len(optional_data)))),
+
         scene=dict(
             aspectmode=PLOT_ASPECTMODE_SETUP_AND_EVENT,
             camera=get_camera_view(),
 
-            xaxis=dict(
-                title=PLOT_AXIS_TITLE_X,
-                backgroundcolor=COLOR_CANVAS,
-                gridcolor=COLOR_GRID,
-                linecolor=COLOR_GRID,
-                zerolinecolor=COLOR_ZERO_LINE,
-                zerolinewidth=PLOT_ZERO_LINE_WIDTH),
-
-            yaxis=dict(
-                title=PLOT_AXIS_TITLE_Y,
-                gridcolor=COLOR_GRID,
-                linecolor=COLOR_GRID,
-                backgroundcolor=COLOR_CANVAS,
-                zerolinecolor=COLOR_ZERO_LINE,
-                zerolinewidth=PLOT_ZERO_LINE_WIDTH),
-
-            zaxis=dict(
-                title=PLOT_AXIS_TITLE_Z,
-                gridcolor=COLOR_GRID,
-                linecolor=COLOR_GRID,
-                backgroundcolor=COLOR_CANVAS,
-                zerolinecolor=COLOR_ZERO_LINE,
-                zerolinewidth=PLOT_ZERO_LINE_WIDTH)))
-
-    data = [patient_mesh, source_mesh, table_mesh, detector_mesh, pad_mesh,
-            beam_mesh, wf_beam, wf_table, wf_pad, wf_detector]
+            xaxis=dict(AXIS_SETTINGS, title=PLOT_AXIS_TITLE_X),
+            yaxis=dict(AXIS_SETTINGS, title=PLOT_AXIS_TITLE_Y),
+            zaxis=dict(AXIS_SETTINGS, title=PLOT_AXIS_TITLE_Z)))
+
+    data = initial_data + optional_data
 
     create_plot_and_save_to_file(mode=mode, data=data, layout=layout)
+
+
+def _create_optional_trace_menu(
+        trace_indices: List[int]) -> List[Dict[str, Any]]:
+    """Create the plot menu that shows and hides the optional traces.
+
+    Parameters
+    ----------
+    trace_indices : List[int]
+        Indices of the optional traces, i.e. their positions in
+        initial_data + optional_data. The indices thus depend on the order
+        of the traces in data, and must be updated if that order changes.
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Layout updatemenus with one button to show and one button to hide
+        the optional traces.
+
+    """
+    return [
+        dict(
+            type="buttons",
+            direction="right",
+            showactive=True,
+            active=-1,
+            buttons=[
+                dict(label=PLOT_OPTIONAL_TRACE_BUTTON_LABEL_SHOW,
+                     method="restyle",
+                     args=[{"visible": True}, trace_indices]),
+                dict(label=PLOT_OPTIONAL_TRACE_BUTTON_LABEL_HIDE,
+                     method="restyle",
+                     args=[{"visible": PLOT_OPTIONAL_TRACE_VISIBILITY},
+                           trace_indices])
+            ]
+        )
+    ]
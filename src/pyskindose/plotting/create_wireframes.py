@@ -1,5 +1,6 @@
-from typing import List
+from typing import Tuple, Union
 
+import numpy as np
 import plotly.graph_objects as go
 
 from ..beam_class import Beam
@@ -11,9 +12,24 @@ from ..constants import (
 )
 from ..phantom_class import Phantom
 
+# Vertex indices, in the order they are visited when tracing each wireframe
+WIREFRAME_ORDER_BEAM = np.array(
+    [0, 1, 0, 2, 0, 3, 0, 4, 1, 2, 3, 4, 1], dtype=np.intp)
+
+WIREFRAME_ORDER_PHANTOM = np.array(
+    [0, 1, 2, 3, 4, 5, 6, 7, 0,
+     8, 9, 10, 11, 12, 13, 14, 15, 8,
+     8, 9, 10, 2, 3, 11, 12, 13, 5, 6, 14, 15, 7], dtype=np.intp)
+
+WIREFRAME_ORDER_DETECTOR = np.array(
+    [0, 1, 2, 3, 0,
+     4, 5, 6, 7, 4,
+     4, 5, 1, 2, 6, 7, 3], dtype=np.intp)
+
 
 def create_wireframes(beam: Beam, table: Phantom, pad: Phantom,
-                      line_width: int = 4, visible: bool = True):
+                      line_width: int = 4,
+                      visible: Union[bool, str] = True):
     """Create wireframe versions of the mesh3d objects in plot_geometry.
 
     The purpose of this function is to enhance the plot_geometry plot by
@@ -31,8 +47,11 @@ def create_wireframes(beam: Beam, table: Phantom, pad: Phantom,
         "pad"
     line_width : int, optional
         Line width of the wireframes. Default value is 4.
-    visible : bool, optional
-        Set the visibility of each of the wireframe traces
+    visible : Union[bool, str], optional
+        Set the initial visibility of each of the wireframe traces, either a
+        bool or "legendonly". Hidden traces are still fully built, since the
+        optional trace menu in create_setup_and_event_plot toggles them
+        visible.
 
     """
     # The following section creates a wireframe plot for the X-ray beam
@@ -58,22 +77,10 @@ def create_wireframes(beam: Beam, table: Phantom, pad: Phantom,
 
 
 def _create_beam_wireframe(
-        beam: Beam, line_width: int, visible: bool) -> go.Scatter3d:
-
-    temp_x = [beam.r[0, 0], beam.r[1, 0], beam.r[0, 0], beam.r[2, 0],
-              beam.r[0, 0], beam.r[3, 0], beam.r[0, 0], beam.r[4, 0],
-              beam.r[1, 0], beam.r[2, 0], beam.r[3, 0], beam.r[4, 0],
-              beam.r[1, 0]]
-
-    temp_y = [beam.r[0, 1], beam.r[1, 1], beam.r[0, 1], beam.r[2, 1],
-              beam.r[0, 1], beam.r[3, 1], beam.r[0, 1], beam.r[4, 1],
-              beam.r[1, 1], beam.r[2, 1], beam.r[3, 1], beam.r[4, 1],
-              beam.r[1, 1]]
+        beam: Beam, line_width: int, visible: Union[bool, str]) -> go.Scatter3d:
 
-    temp_z = [beam.r[0, 2], beam.r[1, 2], beam.r[0, 2], beam.r[2, 2],
-              beam.r[0, 2], beam.r[3, 2], beam.r[0, 2], beam.r[4, 2],
-              beam.r[1, 2], beam.r[2, 2], beam.r[3, 2], beam.r[4, 2],
-              beam.r[1, 2]]
+    temp_x, temp_y, temp_z = _gather_wireframe_coordinates(
+        r=beam.r, order=WIREFRAME_ORDER_BEAM)
 
     return _create_wireframe_scatter3d(x=temp_x, y=temp_y, z=temp_z,
                                        line_width=line_width, visible=visible,
@@ -84,36 +91,11 @@ def _create_phantom_object_wireframe(
         obj: Phantom,
         color: str,
         line_width: int,
-        visible: bool
+        visible: Union[bool, str]
         ) -> go.Scatter3d:
 
-    # The following section creates a wireframe plot for the support table
-    x1 = obj.r[0:8, 0].tolist() + [obj.r[0, 0]]
-    y1 = obj.r[0:8, 1].tolist() + [obj.r[0, 1]]
-    z1 = obj.r[0:8, 2].tolist() + [obj.r[0, 2]]
-
-    x2 = obj.r[8:16, 0].tolist() + [obj.r[8, 0]]
-    y2 = obj.r[8:16, 1].tolist() + [obj.r[8, 1]]
-    z2 = obj.r[8:16, 2].tolist() + [obj.r[8, 2]]
-
-    x3 = [obj.r[8, 0], obj.r[9, 0], obj.r[10, 0], obj.r[2, 0],
-          obj.r[3, 0], obj.r[11, 0], obj.r[12, 0], obj.r[13, 0],
-          obj.r[5, 0], obj.r[6, 0], obj.r[14, 0], obj.r[15, 0],
-          obj.r[7, 0]]
-
-    y3 = [obj.r[8, 1], obj.r[9, 1], obj.r[10, 1], obj.r[2, 1],
-          obj.r[3, 1], obj.r[11, 1], obj.r[12, 1], obj.r[13, 1],
-          obj.r[5, 1], obj.r[6, 1], obj.r[14, 1], obj.r[15, 1],
-          obj.r[7, 1]]
-
-    z3 = [obj.r[8, 2], obj.r[9, 2], obj.r[10, 2], obj.r[2, 2],
-          obj.r[3, 2], obj.r[11, 2], obj.r[12, 2], obj.r[13, 2],
-          obj.r[5, 2], obj.r[6, 2], obj.r[14, 2], obj.r[15, 2],
-          obj.r[7, 2]]
-
-    temp_x = x1 + x2 + x3
-    temp_y = y1 + y2 + y3
-    temp_z = z1 + z2 + z3
+    temp_x, temp_y, temp_z = _gather_wireframe_coordinates(
+        r=obj.r, order=WIREFRAME_ORDER_PHANTOM)
 
     return _create_wireframe_scatter3d(x=temp_x, y=temp_y, z=temp_z,
                                        line_width=line_width, visible=visible,
@@ -121,39 +103,42 @@ def _create_phantom_object_wireframe(
 
 
 def _create_detector_wire_frame(
-        beam: Beam, line_width: int, visible: bool) -> go.Scatter3d:
+        beam: Beam, line_width: int, visible: Union[bool, str]) -> go.Scatter3d:
 
-    x1 = beam.det_r[0:4, 0].tolist() + [beam.det_r[0, 0]]
-    y1 = beam.det_r[0:4, 1].tolist() + [beam.det_r[0, 1]]
-    z1 = beam.det_r[0:4, 2].tolist() + [beam.det_r[0, 2]]
+    temp_x, temp_y, temp_z = _gather_wireframe_coordinates(
+        r=beam.det_r, order=WIREFRAME_ORDER_DETECTOR)
 
-    x2 = beam.det_r[4:8, 0].tolist() + [beam.det_r[4, 0]]
-    y2 = beam.det_r[4:8, 1].tolist() + [beam.det_r[4, 1]]
-    z2 = beam.det_r[4:8, 2].tolist() + [beam.det_r[4, 2]]
+    return _create_wireframe_scatter3d(x=temp_x, y=temp_y, z=temp_z,
+                                       line_width=line_width, visible=visible,
+                                       color=COLOR_WIRE_FRAME_DETECTOR)
 
-    x3 = [beam.det_r[4, 0], beam.det_r[5, 0], beam.det_r[1, 0],
-          beam.det_r[2, 0], beam.det_r[6, 0], beam.det_r[7, 0],
-          beam.det_r[3, 0]]
 
-    y3 = [beam.det_r[4, 1], beam.det_r[5, 1], beam.det_r[1, 1],
-          beam.det_r[2, 1], beam.det_r[6, 1], beam.det_r[7, 1],
-          beam.det_r[3, 1]]
+def _gather_wireframe_coordinates(
+        r: np.ndarray, order: np.ndarray
+        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fetch wireframe vertex coordinates in trace order.
+
+    Parameters
+    ----------
+    r : np.ndarray
+        n*3 array with the xyz coordinates of the object vertices
+    order : np.ndarray
+        Vertex indices, in the order the wireframe line should visit them.
 
-    z3 = [beam.det_r[4, 2], beam.det_r[5, 2], beam.det_r[1, 2],
-          beam.det_r[2, 2], beam.det_r[6, 2], beam.det_r[7, 2],
-          beam.det_r[3, 2]]
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        x, y and z coordinates of the wireframe line, as contiguous arrays
+        that plotly can serialize without converting to lists first.
 
-    temp_x = x1 + x2 + x3
-    temp_y = y1 + y2 + y3
-    temp_z = z1 + z2 + z3
+    """
+    x, y, z = np.ascontiguousarray(r[order].T)
 
-    return _create_wireframe_scatter3d(x=temp_x, y=temp_y, z=temp_z,
-                                       line_width=line_width, visible=visible,
-                                       color=COLOR_WIRE_FRAME_DETECTOR)
+    return x, y, z
 
 
-def _create_wireframe_scatter3d(x: List[float], y: List[float], z: List[float],
-                                line_width: int, visible: bool,
+def _create_wireframe_scatter3d(x: np.ndarray, y: np.ndarray, z: np.ndarray,
+                                line_width: int, visible: Union[bool, str],
                                 color: str) -> go.Scatter3d:
     return go.Scatter3d(x=x, y=y, z=z, mode="lines",
                         hoverinfo="skip", visible=visible,
@@ -1,9 +1,12 @@
 from typing import Union
 
 from ..beam_class import Beam
-from ..constants import PHANTOM_MODEL_PLANE
+from ..constants import PHANTOM_MODEL_PLANE, VISUAL_OFFSET_PHANTOM_MODEL_PLANE
 from ..phantom_class import Phantom
 
+# Visual offset per phantom model. Models not listed here are not offset.
+VISUAL_OFFSETS = {PHANTOM_MODEL_PLANE: VISUAL_OFFSET_PHANTOM_MODEL_PLANE}
+
 
 def _get_visual_offset(patient: Union[Phantom, Beam]) -> float:
     """Set visual offset of phantom objects.
@@ -15,13 +18,8 @@ def _get_visual_offset(patient: Union[Phantom, Beam]) -> float:
     ----------
     patient : Phantom
         Patient phantom from instance of class Phantom. Can be of
-        phantom_model "plane", "cylinder" or "human"
+        phantom_model "plane", "cylinder" or "human". Objects without a
+        phantom_model, such as the Beam, are not offset.
 
     """
-    if not isinstance(patient, Phantom):
-        return 0.0
-
-    if patient.phantom_model == PHANTOM_MODEL_PLANE:
-        return -0.01
-
-    return 0.0
+    return VISUAL_OFFSETS.get(getattr(patient, 'phantom_model', None), 0.0)
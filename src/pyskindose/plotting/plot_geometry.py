@@ -1,10 +1,17 @@
 import pandas as pd
 
 from pyskindose.phantom_class import Phantom
+from ..constants import MODE_PLOT_EVENT, MODE_PLOT_PROCEDURE, MODE_PLOT_SETUP
 from .plot_event import plot_event
 from .plot_procedure import plot_procedure
 from .plot_setup import plot_setup
 
+# Plot function of each geometry plot mode
+PLOT_FUNCTIONS = {
+    MODE_PLOT_SETUP: plot_setup,
+    MODE_PLOT_EVENT: plot_event,
+    MODE_PLOT_PROCEDURE: plot_procedure}
+
 
 def plot_geometry(patient: Phantom, table: Phantom, pad: Phantom,
                   data_norm: pd.DataFrame, mode: str, event: int = 0,
@@ -60,31 +67,22 @@ def plot_geometry(patient: Phantom, table: Phantom, pad: Phantom,
         function. WARNING, very heavy on memory. Default is False.
 
     """
-    plot_setup(
-        mode=mode,
-        data_norm=data_norm,
-        patient=patient,
-        table=table,
-        pad=pad,
-        dark_mode=dark_mode,
-        notebook_mode=notebook_mode)
+    plot_function = PLOT_FUNCTIONS.get(mode)
 
-    plot_event(
-        mode=mode,
-        data_norm=data_norm,
-        event=event,
-        patient=patient,
-        table=table,
-        pad=pad,
-        dark_mode=dark_mode,
-        notebook_mode=notebook_mode)
+    if plot_function is None:
+        return
+
+    # Arguments only used in some of the plot modes
+    mode_arguments = {
+        MODE_PLOT_EVENT: dict(event=event),
+        MODE_PLOT_PROCEDURE: dict(include_patient=include_patient)}
 
-    plot_procedure(
+    plot_function(
         mode=mode,
         data_norm=data_norm,
-        include_patient=include_patient,
         patient=patient,
         table=table,
         pad=pad,
         dark_mode=dark_mode,
-        notebook_mode=notebook_mode)
+        notebook_mode=notebook_mode,
+        **mode_arguments.get(mode, {}))
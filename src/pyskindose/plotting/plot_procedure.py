@@ -1,9 +1,13 @@
 import logging
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 from .plot_settings import (
+    fetch_axis_settings,
     fetch_plot_colors,
     fetch_slider_colors,
     fetch_slider_padding,
@@ -21,19 +25,24 @@ from ..constants import (
     PLOT_AXIS_TITLE_Y,
     PLOT_AXIS_TITLE_Z,
     PLOT_DRAGMODE,
+    PLOT_EVENT_FRAME_ANIMATION,
     PLOT_FONT_FAMILY,
     PLOT_FONT_SIZE,
     PLOT_HOVERLABEL_FONT_FAMILY,
+    PLOT_OUTPUT_FORMAT_HTML,
     PLOT_PROCEDURE_AXIS_RANGE_X,
     PLOT_PROCEDURE_AXIS_RANGE_Y,
     PLOT_PROCEDURE_AXIS_RANGE_Z,
+    PLOT_PROCEDURE_CACHE_MAX_BYTES,
+    PLOT_PROCEDURE_COORDINATE_DECIMALS,
+    PLOT_PROCEDURE_MAX_SLIDER_EVENTS,
     PLOT_SLIDER_BORDER_WIDTH,
     PLOT_SLIDER_FONT_SIZE_CURRENT,
     PLOT_SLIDER_FONT_SIZE_GENERAL,
     PLOT_SLIDER_TRANSITION,
     PLOT_TITLE_FONT_FAMILY,
     PLOT_TITLE_FONT_SIZE,
-    PLOT_ZERO_LINE_WIDTH,
+    PLOT_UIREVISION,
 )
 
 from .create_irradiation_event_procedure_plot_data import (
@@ -41,10 +50,30 @@ from .create_irradiation_event_procedure_plot_data import (
 
 from .create_plot_and_save_to_file import create_plot_and_save_to_file
 from .get_camera_view import get_camera_view
+from ..beam_class import Beam
 from ..phantom_class import Phantom
 
 logger = logging.getLogger(__name__)
 
+# Normalized RDSR parameters that determine where the phantoms and the beam
+# are drawn in a single irradiation event
+EVENT_GEOMETRY_PARAMETERS = [
+    'Tx', 'Ty', 'Tz', 'At1', 'At2', 'At3', 'Ap1', 'Ap2', 'Ap3',
+    'DSI', 'DID', 'FS_lat', 'FS_long']
+
+# Normalized RDSR parameters that determine where the phantoms are positioned
+# in a single irradiation event, see Phantom.position
+PHANTOM_POSITION_PARAMETERS = ['Tx', 'Ty', 'Tz', 'At1', 'At2', 'At3']
+
+PhantomPositions = Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]
+
+# Positioned phantom vertices from previous calls, most recently used last.
+# Only the vertex arrays are kept, not the plotly traces built from them,
+# which are many times larger due to the hover texts.
+_PHANTOM_POSITION_CACHE: 'OrderedDict[tuple, PhantomPositions]' = \
+    OrderedDict()
+_phantom_position_cache_bytes = 0
+
 
 def plot_procedure(
         mode: str,
@@ -54,7 +83,10 @@ def plot_procedure(
         include_patient: bool,
         patient: Optional[Phantom] = None,
         dark_mode: bool = True,
-        notebook_mode: bool = False):
+        notebook_mode: bool = False,
+        max_slider_events: int = PLOT_PROCEDURE_MAX_SLIDER_EVENTS,
+        output_format: str = PLOT_OUTPUT_FORMAT_HTML,
+        output_dir: Optional[str] = None):
     """Create plot_procedure plot.
 
     Parameters
@@ -75,16 +107,33 @@ def plot_procedure(
         set dark mode for plots, by default True
     notebook_mode : bool, optional
         optimize plot size for notebooks, default is True.
+    max_slider_events : int, optional
+        Maximum number of irradiation events in the event slider, at least 3.
+        Procedures with more events are downsampled to the events that best
+        preserve the course of the table and beam geometry.
+    output_format : str, optional
+        "html" (default) shows the interactive plot with an event slider,
+        "jpeg_frames" instead saves one static image per irradiation event,
+        e.g. plot_procedure_0.jpeg for the first event.
+    output_dir : Optional[str], optional
+        Directory to save the "jpeg_frames" images in, by default the
+        current working directory.
 
     Raises
     ------
     IOError
         Raises error if patient not provided when include_patient = True
+    ValueError
+        Raises error if max_slider_events is less than 3
 
     """
     if mode != MODE_PLOT_PROCEDURE:
         return
 
+    if max_slider_events < 3:
+        raise ValueError(
+            f"max_slider_events must be at least 3, got {max_slider_events}")
+
     if include_patient and patient is None:
         logger.error(
             "Plot procedure called with include patient but no patient input")
@@ -96,25 +145,69 @@ def plot_procedure(
 
     title = f"<b>P</b>y<b>S</b>kin<b>D</b>ose [mode: {mode}]"
 
-    meshes = [
-        create_irradiation_event_procedure_plot_data(
-            data_norm=data_norm,
-            include_patient=include_patient,
-            visible_status=(ind == 0),
-            event=ind,
-            patient=(patient if include_patient else None),
-            table=table,
-            pad=pad
-        )
-        for ind in range(len(data_norm))
-    ]
-
-    data = [event.get(plot_object)
-            for plot_object in meshes[0].keys()
-            for event in meshes]
+    patient = patient if include_patient else None
+
+    events = _select_slider_events(
+        data_norm=data_norm, max_events=max_slider_events)
+
+    if len(events) < len(data_norm):
+        logger.info(
+            f"Showing {len(events)} representative irradiation events in "
+            "the event slider")
+
+    # Consecutive events often share the same geometry, and notebook users
+    # often re-run the same procedure. The phantoms are positioned once per
+    # table position, and kept between calls. The plot data is built once
+    # per geometry in this call.
+    phantom_positions = _fetch_phantom_positions(
+        data_norm=data_norm.iloc[events], table=table, pad=pad,
+        patient=patient)
+
+    event_geometries = data_norm[EVENT_GEOMETRY_PARAMETERS].iloc[
+        events].itertuples(index=False, name=None)
+
+    # One beam, repositioned for each new event
+    beam = Beam(data_norm, event=events[0], plot_setup=False)
+
+    event_plot_data = {}
+    meshes = []
+    for ind, geometry, positions in zip(
+            events, event_geometries, phantom_positions):
+
+        if geometry not in event_plot_data:
+            event_plot_data[geometry] = \
+                create_irradiation_event_procedure_plot_data(
+                    data_norm=data_norm,
+                    include_patient=include_patient,
+                    visible_status=True,
+                    event=ind,
+                    patient=patient,
+                    table=table,
+                    pad=pad,
+                    phantom_positions=positions,
+                    beam=beam
+                )
+
+        meshes.append(event_plot_data[geometry])
+
+    # The cached positions are read-only, leave the phantoms in the last
+    # plotted position with vertices of their own
+    for phantom in (table, pad, patient):
+        if phantom is not None:
+            phantom.r = phantom.r.copy()
+
+    # One trace per plot object, showing the first event. The slider swaps
+    # in the data of the other events from one animation frame per event.
+    data = list(meshes[0].values())
+
+    frames = [go.Frame(data=[_create_frame_trace(trace=trace)
+                             for trace in event.values()],
+                       name=str(ind))
+              for ind, event in zip(events, meshes)]
 
     layout = _create_procedure_layout(
         title=title,
+        events=tuple(events),
         total_events=len(data_norm),
         dark_mode=dark_mode,
         notebook_mode=notebook_mode)
@@ -122,24 +215,281 @@ def plot_procedure(
     create_plot_and_save_to_file(
         mode=mode,
         data=data,
-        layout=layout)
+        layout=layout,
+        frames=frames,
+        output_format=output_format,
+        output_dir=output_dir)
+
+
+def _select_slider_events(
+        data_norm: pd.DataFrame, max_events: int) -> List[int]:
+    """Select the irradiation events to show in the event slider.
+
+    All events are shown if there are at most max_events of them. Otherwise
+    the events are downsampled with the largest triangle three buckets
+    (LTTB) method. The events are split into max_events - 2 buckets between
+    the first and last event, and from each bucket the event that spans the
+    largest triangle with the previously selected event and the mean of the
+    next bucket is kept. The triangles are spanned in the space of event
+    index and geometry parameters, each scaled to its range, so that abrupt
+    table or beam movements are kept.
+
+    Parameters
+    ----------
+    data_norm : pd.DataFrame
+        RDSR data, normalized for compliance with PySkinDose.
+    max_events : int
+        Maximum number of events to select, at least 3.
+
+    Returns
+    -------
+    List[int]
+        Indices of the selected events, in increasing order.
+
+    """
+    total_events = len(data_norm)
+
+    if total_events <= max_events:
+        return list(range(total_events))
+
+    points = np.column_stack((
+        np.arange(total_events),
+        data_norm[EVENT_GEOMETRY_PARAMETERS].to_numpy(dtype=float)))
+
+    value_range = np.ptp(points, axis=0)
+    points /= np.where(value_range > 0, value_range, 1)
+
+    buckets = np.array_split(np.arange(1, total_events - 1), max_events - 2)
+    next_buckets = buckets[1:] + [np.array([total_events - 1])]
+
+    events = [0]
+    for bucket, next_bucket in zip(buckets, next_buckets):
+        ab = points[bucket] - points[events[-1]]
+        ac = points[next_bucket].mean(axis=0) - points[events[-1]]
+
+        # Squared triangle areas (times four), valid in any dimension
+        area = np.sum(ab ** 2, axis=1) * np.sum(ac ** 2) - np.dot(ab, ac) ** 2
+
+        events.append(int(bucket[np.argmax(area)]))
+
+    events.append(total_events - 1)
+
+    return events
+
+
+def _fetch_phantom_positions(
+        data_norm: pd.DataFrame,
+        table: Phantom,
+        pad: Phantom,
+        patient: Optional[Phantom] = None) -> List[PhantomPositions]:
+    """Fetch the table, pad and patient vertices for all events in data_norm.
+
+    Positions from previous calls are taken from the cache. The phantoms are
+    positioned for the remaining table positions all at once, with
+    Phantom.position_all, and the new positions are added to the cache. The
+    returned arrays are read-only, since they may be shared with later calls.
+
+    Parameters
+    ----------
+    data_norm : pd.DataFrame
+        RDSR data, normalized for compliance with PySkinDose.
+    table : Phantom
+        Patient support table phantom
+    pad : Phantom
+        Patient support pad phantom
+    patient : Optional[Phantom], optional
+        patient phantom, by default None
+
+    Returns
+    -------
+    List[PhantomPositions]
+        Table, pad and patient vertices in each event in data_norm. None for
+        a missing patient.
+
+    """
+    phantom_fingerprints = _fetch_phantom_fingerprints(
+        table=table, pad=pad, patient=patient)
+
+    cache_keys = [
+        (phantom_fingerprints, position)
+        for position in data_norm[PHANTOM_POSITION_PARAMETERS].itertuples(
+            index=False, name=None)]
+
+    positions = {cache_key: _PHANTOM_POSITION_CACHE[cache_key]
+                 for cache_key in cache_keys
+                 if cache_key in _PHANTOM_POSITION_CACHE}
+
+    # Position the phantoms for all table positions that are not cached
+    new_rows = {}
+    for row, cache_key in enumerate(cache_keys):
+        if cache_key not in positions:
+            new_rows.setdefault(cache_key, row)
+
+    if new_rows:
+        new_positions = tuple(
+            None if phantom is None
+            else phantom.position_all(data_norm.iloc[list(new_rows.values())])
+            for phantom in (table, pad, patient))
+
+        for row, cache_key in enumerate(new_rows):
+            positions[cache_key] = tuple(
+                None if phantom_r is None else _read_only_copy(phantom_r[row])
+                for phantom_r in new_positions)
+
+    for cache_key in dict.fromkeys(cache_keys):
+        _add_to_phantom_position_cache(
+            cache_key=cache_key, positions=positions[cache_key])
+
+    return [positions[cache_key] for cache_key in cache_keys]
+
+
+def _read_only_copy(a: np.ndarray) -> np.ndarray:
+    """Copy an array into memory of its own, and make the copy read-only."""
+    a = a.copy()
+    a.setflags(write=False)
+
+    return a
 
 
-def _create_event_slider_step(total_events: int, event: int) -> Dict[str, Any]:
+def _add_to_phantom_position_cache(
+        cache_key: tuple, positions: PhantomPositions) -> None:
+    """Add, or refresh, phantom positions in the phantom position cache.
 
-    step = {
-        IRRADIATION_EVENT_STEP_KEY_METHOD: "restyle",
+    The least recently used positions are dropped until the cache holds at
+    most PLOT_PROCEDURE_CACHE_MAX_BYTES of vertices.
+
+    Parameters
+    ----------
+    cache_key : tuple
+        Phantom fingerprints and table position of the positions
+    positions : PhantomPositions
+        Table, pad and patient vertices, None for a missing patient.
+
+    """
+    global _phantom_position_cache_bytes
+
+    if cache_key in _PHANTOM_POSITION_CACHE:
+        _PHANTOM_POSITION_CACHE.move_to_end(cache_key)
+        return
+
+    _PHANTOM_POSITION_CACHE[cache_key] = positions
+    _phantom_position_cache_bytes += _fetch_nbytes(positions)
+
+    while _phantom_position_cache_bytes > PLOT_PROCEDURE_CACHE_MAX_BYTES:
+        _, dropped = _PHANTOM_POSITION_CACHE.popitem(last=False)
+        _phantom_position_cache_bytes -= _fetch_nbytes(dropped)
+
+
+def _fetch_nbytes(positions: PhantomPositions) -> int:
+    """Fetch the total size in bytes of the vertex arrays in positions."""
+    return sum(phantom_r.nbytes for phantom_r in positions
+               if phantom_r is not None)
+
+
+def clear_plot_procedure_cache() -> None:
+    """Clear the phantom positions kept between plot_procedure calls."""
+    global _phantom_position_cache_bytes
+
+    _PHANTOM_POSITION_CACHE.clear()
+    _phantom_position_cache_bytes = 0
+
+
+def _create_frame_trace(
+        trace: Union[go.Mesh3d, go.Scatter3d]
+        ) -> Union[go.Mesh3d, go.Scatter3d]:
+    """Create the animation frame version of an irradiation event trace.
+
+    Animation frames are merged into the traces of the figure, so a frame
+    only needs the vertex coordinates and hover texts that change between
+    events. Leaving out the triangle indices and styling keeps them out of
+    the figure JSON for every event. The coordinates are rounded to
+    PLOT_PROCEDURE_COORDINATE_DECIMALS, since plotly writes them as decimal
+    text and full float64 precision about doubles their size in the JSON.
+
+    Parameters
+    ----------
+    trace : Union[go.Mesh3d, go.Scatter3d]
+        Trace of a plot object in a single irradiation event
+
+    """
+    x, y, z = (np.round(coordinates, PLOT_PROCEDURE_COORDINATE_DECIMALS)
+               for coordinates in (trace.x, trace.y, trace.z))
+
+    return type(trace)(x=x, y=y, z=z, text=trace.text)
+
+
+def _fetch_phantom_fingerprints(
+        table: Phantom,
+        pad: Phantom,
+        patient: Optional[Phantom] = None) -> Tuple[Optional[int], ...]:
+    """Fingerprint the reference geometry of the plotted phantoms.
+
+    The fingerprints identify phantoms by content rather than by object,
+    so that phantom positions cached in a previous call to plot_procedure
+    are reused for new, but identical, phantom instances.
+
+    Parameters
+    ----------
+    table : Phantom
+        Patient support table phantom
+    pad : Phantom
+        Patient support pad phantom
+    patient : Optional[Phantom], optional
+        patient phantom, by default None
+
+    Returns
+    -------
+    Tuple[Optional[int], ...]
+        One fingerprint per phantom, None for a missing patient.
+
+    """
+    return tuple(
+        None if phantom is None else hash((
+            phantom.phantom_model,
+            phantom.table_length,
+            phantom.r_ref.tobytes(),
+            phantom.ijk.tobytes()))
+        for phantom in (table, pad, patient))
+
+
+def _create_event_slider_step(event: int) -> Dict[str, Any]:
+    """Create the slider step that shows a single irradiation event.
+
+    Parameters
+    ----------
+    event : int
+        Index of the irradiation event shown by this step. The step
+        animates to the frame with the same name.
+
+    """
+    return {
+        IRRADIATION_EVENT_STEP_KEY_METHOD: "animate",
         IRRADIATION_EVENT_STEP_KEY_ARGUMENTS:
-            ['visible', [False] * total_events],
+            [[str(event)], PLOT_EVENT_FRAME_ANIMATION],
         IRRADIATION_EVENT_STEP_KEY_LABEL: event + 1
     }
-    step[IRRADIATION_EVENT_STEP_KEY_ARGUMENTS][1][event] = True
 
-    return step
+
+@lru_cache(maxsize=8)
+def _create_event_slider_steps(
+        events: Tuple[int, ...]) -> Tuple[Dict[str, Any], ...]:
+    """Create the slider steps for the plotted irradiation events.
+
+    The steps only depend on the plotted events, so they are cached and
+    shared between plots, e.g. when re-plotting a procedure in another
+    dark_mode or notebook_mode. Do not modify the returned steps.
+
+    Parameters
+    ----------
+    events : Tuple[int, ...]
+        Indices of the irradiation events shown in the slider
+
+    """
+    return tuple(_create_event_slider_step(event=ind) for ind in events)
 
 
 def _create_sliders(
-        steps: List[Dict],
+        steps: Sequence[Dict],
         total_events: int,
         dark_mode: bool = True,
         notebook_mode: bool = False) -> List[Dict[str, Any]]:
@@ -175,21 +525,29 @@ def _create_sliders(
 
 def _create_procedure_layout(
         title: str,
+        events: Tuple[int, ...],
         total_events: int,
         dark_mode: bool = True,
-        notebook_mode: bool = False) -> go.Layout:
+        notebook_mode: bool = False) -> Dict[str, Any]:
+    """Create the plot_procedure layout.
 
-    steps = [_create_event_slider_step(
-        total_events=total_events, event=ind) for ind in range(total_events)]
+    The layout is returned as a plain dict rather than a go.Layout, so that
+    plotly validates it once, when the figure is created.
+
+    """
+    steps = _create_event_slider_steps(events=events)
 
     COLOR_CANVAS, COLOR_PLOT_TEXT, COLOR_GRID, COLOR_ZERO_LINE = \
         fetch_plot_colors(dark_mode=dark_mode)
 
+    AXIS_SETTINGS = dict(
+        fetch_axis_settings(dark_mode=dark_mode), color=COLOR_PLOT_TEXT)
+
     PLOT_HEIGHT, PLOT_WIDTH = fetch_plot_size(notebook_mode=notebook_mode)
 
     PLOT_MARGIN = fetch_plot_margin(notebook_mode=notebook_mode)
 
-    layout = go.Layout(
+    layout = dict(
 
         height=PLOT_HEIGHT,
         width=PLOT_WIDTH,
@@ -214,6 +572,7 @@ def _create_procedure_layout(
 
         showlegend=False,
         dragmode=PLOT_DRAGMODE,
+        uirevision=PLOT_UIREVISION,
         title=title,
 
         titlefont=dict(
@@ -225,32 +584,15 @@ def _create_procedure_layout(
         paper_bgcolor=COLOR_CANVAS,
         scene=dict(aspectmode=PLOT_ASPECTMODE_PLOT_PROCEDURE,
                    camera=get_camera_view(),
-                   xaxis=dict(title=PLOT_AXIS_TITLE_X,
-                              range=PLOT_PROCEDURE_AXIS_RANGE_X,
-                              color=COLOR_PLOT_TEXT,
-                              gridcolor=COLOR_GRID,
-                              linecolor=COLOR_GRID,
-                              backgroundcolor=COLOR_CANVAS,
-                              zerolinecolor=COLOR_ZERO_LINE,
-                              zerolinewidth=PLOT_ZERO_LINE_WIDTH),
-
-                   yaxis=dict(title=PLOT_AXIS_TITLE_Y,
-                              range=PLOT_PROCEDURE_AXIS_RANGE_Y,
-                              color=COLOR_PLOT_TEXT,
-                              gridcolor=COLOR_GRID,
-                              linecolor=COLOR_GRID,
-                              backgroundcolor=COLOR_CANVAS,
-                              zerolinecolor=COLOR_ZERO_LINE,
-                              zerolinewidth=PLOT_ZERO_LINE_WIDTH),
-
-                   zaxis=dict(title=PLOT_AXIS_TITLE_Z,
-                              range=PLOT_PROCEDURE_AXIS_RANGE_Z,
-                              color=COLOR_PLOT_TEXT,
-                              gridcolor=COLOR_GRID,
-                              linecolor=COLOR_GRID,
-                              backgroundcolor=COLOR_CANVAS,
-                              zerolinecolor=COLOR_ZERO_LINE,
-                              zerolinewidth=PLOT_ZERO_LINE_WIDTH)
+                   xaxis=dict(AXIS_SETTINGS,
+                              title=PLOT_AXIS_TITLE_X,
+                              range=PLOT_PROCEDURE_AXIS_RANGE_X),
+                   yaxis=dict(AXIS_SETTINGS,
+                              title=PLOT_AXIS_TITLE_Y,
+                              range=PLOT_PROCEDURE_AXIS_RANGE_Y),
+                   zaxis=dict(AXIS_SETTINGS,
+                              title=PLOT_AXIS_TITLE_Z,
+                              range=PLOT_PROCEDURE_AXIS_RANGE_Z)
                    )
     )
 
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Any, Dict
+
 from ..constants import (
     COLOR_CANVAS_DARK,
     COLOR_CANVAS_LIGHT,
@@ -19,8 +22,31 @@ from ..constants import (
     PLOT_SLIDER_PADDING_NOTEBOOK,
     PLOT_WIDTH,
     PLOT_WIDTH_NOTEBOOK,
+    PLOT_ZERO_LINE_WIDTH,
 )
 
+# Plot settings per dark_mode (colors) and notebook_mode (sizes)
+PLOT_COLORS = {
+    True: (COLOR_CANVAS_DARK, COLOR_PLOT_TEXT_DARK, COLOR_GRID_DARK,
+           COLOR_ZERO_LINE_DARK),
+    False: (COLOR_CANVAS_LIGHT, COLOR_PLOT_TEXT_LIGHT, COLOR_GRID_LIGHT,
+            COLOR_ZERO_LINE_LIGHT)}
+
+SLIDER_COLORS = {
+    True: (COLOR_PLOT_TEXT_DARK, COLOR_SLIDER_TICK_DARK,
+           COLOR_SLIDER_BORDER_DARK),
+    False: (COLOR_PLOT_TEXT_LIGHT, COLOR_SLIDER_TICK_LIGHT,
+            COLOR_SLIDER_BORDER_LIGHT)}
+
+PLOT_SIZES = {
+    True: (PLOT_HEIGHT_NOTEBOOK, PLOT_WIDTH_NOTEBOOK),
+    False: (PLOT_HEIGHT, PLOT_WIDTH)}
+
+PLOT_MARGINS = {True: PLOT_MARGIN_NOTEBOOK, False: PLOT_MARGIN}
+
+SLIDER_PADDINGS = {True: PLOT_SLIDER_PADDING_NOTEBOOK,
+                   False: PLOT_SLIDER_PADDING}
+
 
 def fetch_plot_colors(dark_mode: bool):
     """Fetch correct colors scheme for plotly plots.
@@ -31,12 +57,7 @@ def fetch_plot_colors(dark_mode: bool):
         Specifies whether dark mode should be implemented
 
     """
-    if dark_mode:
-        return COLOR_CANVAS_DARK, COLOR_PLOT_TEXT_DARK, COLOR_GRID_DARK, \
-            COLOR_ZERO_LINE_DARK
-
-    return COLOR_CANVAS_LIGHT, COLOR_PLOT_TEXT_LIGHT, COLOR_GRID_LIGHT, \
-        COLOR_ZERO_LINE_LIGHT
+    return PLOT_COLORS[bool(dark_mode)]
 
 
 def fetch_slider_colors(dark_mode: bool):
@@ -48,12 +69,7 @@ def fetch_slider_colors(dark_mode: bool):
         Specifies whether dark mode should be implemented
 
     """
-    if dark_mode:
-        return COLOR_PLOT_TEXT_DARK, COLOR_SLIDER_TICK_DARK, \
-            COLOR_SLIDER_BORDER_DARK,
-
-    return COLOR_PLOT_TEXT_LIGHT, COLOR_SLIDER_TICK_LIGHT, \
-        COLOR_SLIDER_BORDER_LIGHT
+    return SLIDER_COLORS[bool(dark_mode)]
 
 
 def fetch_plot_size(notebook_mode: bool):
@@ -65,10 +81,7 @@ def fetch_plot_size(notebook_mode: bool):
         specifies whether plot size should be optimized for notebooks
 
     """
-    if notebook_mode:
-        return PLOT_HEIGHT_NOTEBOOK, PLOT_WIDTH_NOTEBOOK
-
-    return PLOT_HEIGHT, PLOT_WIDTH
+    return PLOT_SIZES[bool(notebook_mode)]
 
 
 def fetch_plot_margin(notebook_mode: bool):
@@ -80,10 +93,7 @@ def fetch_plot_margin(notebook_mode: bool):
         Specifies whether plot margins should be optimized for notebooks
 
     """
-    if notebook_mode:
-        return PLOT_MARGIN_NOTEBOOK
-
-    return PLOT_MARGIN
+    return PLOT_MARGINS[bool(notebook_mode)]
 
 
 def fetch_slider_padding(notebook_mode: bool):
@@ -95,7 +105,28 @@ def fetch_slider_padding(notebook_mode: bool):
         Specifies whether the slider padding should be optimized for notebooks
 
     """
-    if notebook_mode:
-        return PLOT_SLIDER_PADDING_NOTEBOOK
+    return SLIDER_PADDINGS[bool(notebook_mode)]
 
-    return PLOT_SLIDER_PADDING
+
+@lru_cache(maxsize=None)
+def fetch_axis_settings(dark_mode: bool) -> Dict[str, Any]:
+    """Fetch the axis settings shared by the x, y and z axis in 3D plots.
+
+    The returned dict is cached and shared between calls, so extend it into a
+    new dict, e.g. dict(axis_settings, title=...), rather than modifying it.
+
+    Parameters
+    ----------
+    dark_mode : bool
+        Specifies whether dark mode should be implemented
+
+    """
+    COLOR_CANVAS, _, COLOR_GRID, COLOR_ZERO_LINE = \
+        fetch_plot_colors(dark_mode=dark_mode)
+
+    return dict(
+        backgroundcolor=COLOR_CANVAS,
+        gridcolor=COLOR_GRID,
+        linecolor=COLOR_GRID,
+        zerolinecolor=COLOR_ZERO_LINE,
+        zerolinewidth=PLOT_ZERO_LINE_WIDTH)
@@ -1,6 +1,9 @@
+import numpy as np
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 import json
+from typing import Any, Dict
 from .settings_normalization import NormalizationSettings
 from .geom_calc import calculate_field_size
 
@@ -115,101 +118,143 @@ def rdsr_normalizer(data_parsed: pd.DataFrame) -> pd.DataFrame:
         Copper X-ray filter thickness in mm.
     """
 
-    data_norm = pd.DataFrame()
-    normalization_settings_path = \
-        Path(__file__).parent / "normalization_settings.json"
-
-    with normalization_settings_path.open("r") as json_file:
-        normalization_settings = json.load(json_file)
-
     norm = NormalizationSettings(
-        normalization_settings=normalization_settings,
+        normalization_settings=_read_normalization_settings(),
         data_parsed=data_parsed)
 
-    data_norm = _normalize_machine_parameters(
-        data_parsed=data_parsed, data_norm=data_norm, norm=norm)
+    # Collect all normalized columns first, so that the dataframe is built in
+    # one go rather than by inserting one column at the time.
+    columns = _normalize_machine_parameters(
+        data_parsed=data_parsed, norm=norm)
 
-    data_norm = _normalize_table_parameters(
-        data_parsed=data_parsed, data_norm=data_norm, norm=norm)
+    columns.update(_normalize_table_parameters(
+        data_parsed=data_parsed, norm=norm))
 
-    data_norm = _normalize_beam_parameters(
-            data_parsed=data_parsed, data_norm=data_norm, norm=norm)
+    columns.update(_normalize_beam_parameters(
+        data_parsed=data_parsed, data_norm=columns, norm=norm))
 
-    return data_norm
+    return pd.DataFrame(columns)
 
 
-def _normalize_machine_parameters(
-        data_parsed: pd.DataFrame,
-        data_norm: pd.DataFrame,
-        norm: NormalizationSettings) -> pd.DataFrame:
+@lru_cache(maxsize=1)
+def _read_normalization_settings() -> Dict[str, Any]:
+    """Read the normalization settings shipped with PySkinDose.
+
+    The settings file is static, so it is only read and parsed once per
+    session. NormalizationSettings only reads from the returned dict, so
+    it is shared between calls rather than copied.
 
-    data_norm['model'] = data_parsed.ManufacturerModelName
-    data_norm['DSD'] = data_parsed.DistanceSourcetoDetector_mm / 10
-    data_norm['DSI'] = data_parsed.DistanceSourcetoIsocenter_mm / 10
-    data_norm['DID'] = data_norm.DSD - data_norm.DSI
-    data_norm["DSIRP"] = data_norm.DSI - 15
-    data_norm["acquisition_type"] = data_parsed.IrradiationEventType
-    data_norm["acquisition_plane"] = data_parsed.AcquisitionPlane
+    Returns
+    -------
+    Dict[str, Any]
+        Content of normalization_settings.json
+
+    """
+    normalization_settings_path = \
+        Path(__file__).parent / "normalization_settings.json"
 
-    return data_norm
+    with normalization_settings_path.open("r") as json_file:
+        return json.load(json_file)
 
 
-def _normalize_table_parameters(
+def _normalize_machine_parameters(
         data_parsed: pd.DataFrame,
-        data_norm: pd.DataFrame,
-        norm: NormalizationSettings) -> pd.DataFrame:
+        norm: NormalizationSettings) -> Dict[str, Any]:
+
+    # Unit conversions are done on the underlying arrays, without the
+    # pandas dispatch and index alignment of series arithmetic
+    DSD = data_parsed.DistanceSourcetoDetector_mm.to_numpy(
+        dtype=np.float64) / 10
+    DSI = data_parsed.DistanceSourcetoIsocenter_mm.to_numpy(
+        dtype=np.float64) / 10
+
+    # The string columns only hold a few distinct values, which are stored
+    # once per category rather than once per event.
+    return {
+        'model': pd.Categorical(data_parsed.ManufacturerModelName),
+        'DSD': DSD,
+        'DSI': DSI,
+        'DID': DSD - DSI,
+        'DSIRP': DSI - 15,
+        'acquisition_type': pd.Categorical(data_parsed.IrradiationEventType),
+        'acquisition_plane': pd.Categorical(data_parsed.AcquisitionPlane)}
+
 
-    # Table translations
-    data_norm['Tx'] = norm.trans_offset.x + \
-        norm.trans_dir.x * data_parsed.TableLongitudinalPosition_mm / 10
+def _normalize_table_parameters(
+        data_parsed: pd.DataFrame,
+        norm: NormalizationSettings) -> Dict[str, Any]:
+
+    return {
+        # Table translations
+        'Tx': _normalize_table_translation(
+            position_mm=data_parsed.TableLongitudinalPosition_mm,
+            direction=norm.trans_dir.x, offset=norm.trans_offset.x),
+        'Ty': _normalize_table_translation(
+            position_mm=data_parsed.TableHeightPosition_mm,
+            direction=norm.trans_dir.y, offset=norm.trans_offset.y),
+        'Tz': _normalize_table_translation(
+            position_mm=data_parsed.TableLateralPosition_mm,
+            direction=norm.trans_dir.z, offset=norm.trans_offset.z),
+        # Table rotations, temp set to zero, which is zero in either direction
+        'At1': 0,
+        'At2': 0,
+        'At3': 0}
+
+
+def _normalize_table_translation(
+        position_mm: pd.Series, direction: int, offset: float) -> np.ndarray:
+    """Convert a table position in mm to a PySkinDose table translation.
+
+    Computes offset + direction * position_mm / 10 with a single output
+    array that is updated in place, rather than allocating a new series for
+    each operation.
 
-    data_norm['Ty'] = norm.trans_offset.y + \
-        norm.trans_dir.y * data_parsed.TableHeightPosition_mm / 10
+    Parameters
+    ----------
+    position_mm : pd.Series
+        Table position from the RDSR, in mm.
+    direction : int
+        +1 or -1, to switch pos/neg direction of the translation.
+    offset : float
+        Translation offset in cm.
 
-    data_norm['Tz'] = norm.trans_offset.z + \
-        norm.trans_dir.z * data_parsed.TableLateralPosition_mm / 10
+    Returns
+    -------
+    np.ndarray
+        Table translation in cm.
 
-    # Table rotations
-    data_norm["At1"] = norm.rot_dir.At1 * [0] * len(data_norm)
-    data_norm["At2"] = norm.rot_dir.At2 * [0] * len(data_norm)
-    data_norm["At3"] = norm.rot_dir.At3 * [0] * len(data_norm)
+    """
+    translation = position_mm.to_numpy(dtype=np.float64) / 10
+    np.multiply(translation, direction, out=translation)
+    np.add(translation, offset, out=translation)
 
-    return data_norm
+    return translation
 
 
 def _normalize_beam_parameters(
         data_parsed: pd.DataFrame,
-        data_norm: pd.DataFrame,
-        norm: NormalizationSettings) -> pd.DataFrame:
-
-    # beam angulation
-    data_norm["Ap1"] = norm.rot_dir.Ap1 * \
-            data_parsed.PositionerPrimaryAngle_deg
-    data_norm["Ap2"] = norm.rot_dir.Ap2 * \
-        data_parsed.PositionerSecondaryAngle_deg
-    # temp set to zero
-    data_norm["Ap3"] = norm.rot_dir.Ap3 * [0] * len(data_norm)
-
-    # detector side length
-    data_norm['DSL'] = norm.detector_side_length
+        data_norm: Dict[str, Any],
+        norm: NormalizationSettings) -> Dict[str, Any]:
 
     FS_lat, FS_long = calculate_field_size(
         field_size_mode=norm.field_size_mode,
         data_parsed=data_parsed,
         data_norm=data_norm)
 
-    data_norm['FS_lat'] = FS_lat
-    data_norm['FS_long'] = FS_long
-
-    data_norm['kVp'] = data_parsed.KVP_kV
-    data_norm['K_IRP'] = data_parsed.DoseRP_Gy * 1000
-
-    data_norm["filter_thickness_Cu"] = \
-        (data_parsed.XRayFilterThicknessMaximum_mm)
-
-    data_norm.filter_thickness_Cu = (data_norm.filter_thickness_Cu.fillna(0.0))
-
-    data_norm["filter_thickness_Al"] = (
-        [0.0] * len(data_parsed.XRayFilterThicknessMaximum_mm))
-
-    return data_norm
+    return {
+        # beam angulation
+        'Ap1': norm.rot_dir.Ap1 * data_parsed.PositionerPrimaryAngle_deg,
+        'Ap2': norm.rot_dir.Ap2 * data_parsed.PositionerSecondaryAngle_deg,
+        # temp set to zero, which is zero in either direction
+        'Ap3': 0,
+        # detector side length
+        'DSL': norm.detector_side_length,
+        'FS_lat': FS_lat,
+        'FS_long': FS_long,
+        'kVp': data_parsed.KVP_kV,
+        'K_IRP': data_parsed.DoseRP_Gy.to_numpy(dtype=np.float64) * 1000,
+        # Filter thicknesses, events without a reported filter get zero
+        # thickness
+        'filter_thickness_Cu':
+            data_parsed.XRayFilterThicknessMaximum_mm.fillna(0.0),
+        'filter_thickness_Al': 0.0}
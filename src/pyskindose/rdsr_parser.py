@@ -1,23 +1,64 @@
 from datetime import datetime as dt
+from functools import lru_cache
+import sys
+from typing import Any, Dict
 import pandas as pd
 import pydicom
 
 from pyskindose.constants import (
     KEY_RDSR_ACQUISITION_DATA,
     KEY_RDSR_COMMENT,
-    KEY_RDSR_CONCEPT_CODE_SEQUENCE,
     KEY_RDSR_CONTENT_SEQUENCE,
     KEY_RDSR_DATE_TIME,
     KEY_RDSR_DETECTORSIZE_MM,
-    KEY_RDSR_EVENT_XRAY_DATA,
+    KEY_RDSR_EVENT_XRAY_DATA_CODE_VALUE,
     KEY_RDSR_II_DIAMETER_SRDATA,
     KEY_RDSR_MANUFACTURER,
     KEY_RDSR_MANUFACTURER_MODEL_NAME,
-    KEY_RDSR_MEASURED_VALUE_SEQUENCE,
-    KEY_RDSR_TEXT_VALUE,
-    KEY_RDSR_UID,
+    KEY_RDSR_VALUE_TYPE_CODE,
+    KEY_RDSR_VALUE_TYPE_CONTAINER,
+    KEY_RDSR_VALUE_TYPE_NUM,
+    KEY_RDSR_VALUE_TYPE_TEXT,
+    KEY_RDSR_VALUE_TYPE_UIDREF,
 )
 
+# Characters stripped from 'Concept Name' CodeMeanings to form column names
+_TAG_STRIP = str.maketrans("", "", " -().")
+# Characters stripped from measurement unit CodeValues in column names
+_UNIT_STRIP = str.maketrans("", "", ".")
+
+
+# DICOM elements of the RDSR that are used by rdsr_parser
+RDSR_PARSED_ELEMENTS = [
+    KEY_RDSR_CONTENT_SEQUENCE,
+    KEY_RDSR_MANUFACTURER,
+    KEY_RDSR_MANUFACTURER_MODEL_NAME,
+]
+
+
+def load_rdsr(rdsr_filepath: str) -> pydicom.FileDataset:
+    """Read the parts of an RDSR file that are used by rdsr_parser.
+
+    Only the elements in RDSR_PARSED_ELEMENTS are read, and reading stops
+    before any pixel data. Other elements of the file, e.g. patient and
+    study modules, are not decoded.
+
+    Parameters
+    ----------
+    rdsr_filepath : str
+        Path to the RDSR file.
+
+    Returns
+    -------
+    pydicom.FileDataset
+        RDSR file from fluoroscopic device, opened with package pydicom, to
+        be parsed with rdsr_parser.
+
+    """
+    return pydicom.dcmread(
+        rdsr_filepath, stop_before_pixels=True,
+        specific_tags=RDSR_PARSED_ELEMENTS)
+
 
 def rdsr_parser(data_raw: pydicom.FileDataset) -> pd.DataFrame:
     """Parse event data from radiation dose structure reports (RDSR).
@@ -25,7 +66,8 @@ def rdsr_parser(data_raw: pydicom.FileDataset) -> pd.DataFrame:
     Parameters
     ----------
     data_raw : pydicom.FileDataset
-        RDSR file from fluoroscopic device, opened with package pydicom.
+        RDSR file from fluoroscopic device, opened with package pydicom,
+        e.g. with load_rdsr.
 
     Returns
     -------
@@ -33,162 +75,148 @@ def rdsr_parser(data_raw: pydicom.FileDataset) -> pd.DataFrame:
         Parsed RDSR data from all irradiation events in the RDSR input file
 
     """
-    # Declare pandas DataFrame for storage of parsed RDSR data
-    data_parsed = pd.DataFrame(columns=[])
+    # Parsed data of each irradiation event, one dictionary per event. The
+    # DataFrame is built once from all events, rather than by appending each
+    # event, which would copy all previous events every time.
+    data_parsed_events = []
+
+    # Manufacturer and manufacturer model name are the same for all events
+    manufacturer = data_raw.Manufacturer
+    manufacturer_model_name = data_raw.ManufacturerModelName
 
     # For each content in RDSR file
     for rdsr_content in data_raw.ContentSequence:
 
-        # If content = irradiation event
-        if rdsr_content.ConceptNameCodeSequence[0].CodeMeaning\
-                == KEY_RDSR_EVENT_XRAY_DATA:
+        # If content = irradiation event, identified by its short code value
+        # rather than by the CodeMeaning text
+        if rdsr_content.ConceptNameCodeSequence[0].CodeValue\
+                == KEY_RDSR_EVENT_XRAY_DATA_CODE_VALUE:
 
             # Declare temporary dictionary
             data_parsed_dict = dict()
 
             # Save manufacturer, and manufacturer model name
-            data_parsed_dict[KEY_RDSR_MANUFACTURER] = data_raw.Manufacturer
+            data_parsed_dict[KEY_RDSR_MANUFACTURER] = manufacturer
             data_parsed_dict[KEY_RDSR_MANUFACTURER_MODEL_NAME] = \
-                data_raw.ManufacturerModelName
+                manufacturer_model_name
 
             # For each content in 'Irradiation Event X-Ray Data'
             for xray_event_content in rdsr_content.ContentSequence:
-                # Reformat 'Concept Name'
-                tag = (
-                    xray_event_content.ConceptNameCodeSequence[0].CodeMeaning.
-                    replace(" ", "").replace("-", "").replace("(", "").
-                    replace(")", "").replace(".", ""))
-
-                # Save 'Concept Name' to dictionary, assign corresponding value
-                if KEY_RDSR_CONCEPT_CODE_SEQUENCE in xray_event_content:
-                    if tag in data_parsed_dict.keys():
-                        data_parsed_dict[tag] = (
-                            [data_parsed_dict[tag],
-                             xray_event_content.ConceptCodeSequence[0].
-                             CodeMeaning])
-                    else:
-                        data_parsed_dict[tag] = xray_event_content\
-                            .ConceptCodeSequence[0].CodeMeaning
-
-                elif KEY_RDSR_MEASURED_VALUE_SEQUENCE in xray_event_content:
-                    # If the content contains a 'Measured Value Sequence'
-                    # Reformat 'Concept Name' to include unit of measurement
-                    unit = xray_event_content.MeasuredValueSequence[0]\
-                        .MeasurementUnitsCodeSequence[0]\
-                        .CodeValue.replace(".", "")
-
-                    tag = '_'.join([tag, unit])
-
-                    if tag in data_parsed_dict.keys():
-                        data_parsed_dict[tag] = (
-                            [data_parsed_dict[tag],
-                             xray_event_content.MeasuredValueSequence[0].
-                             NumericValue])
-
-                    else:
-                        data_parsed_dict[tag] = xray_event_content\
-                            .MeasuredValueSequence[0].NumericValue
-
-                elif KEY_RDSR_TEXT_VALUE in xray_event_content:
-
-                    # This loop extracts detector size for static acquisitions,
-                    # which is given as a 'Comment' for siemens artis zee units
-                    if tag == KEY_RDSR_COMMENT:
-                        comment = xray_event_content.TextValue.split('/')
-                        if KEY_RDSR_ACQUISITION_DATA in comment[0]:
-                            for index in comment:
-                                if KEY_RDSR_II_DIAMETER_SRDATA in index:
-                                    data_parsed_dict[KEY_RDSR_DETECTORSIZE_MM]\
-                                        = index.split('=')[1].replace('"', '')
-
-                    elif tag in data_parsed_dict.keys():
-                        data_parsed_dict[tag] = (
-                            [data_parsed_dict[tag],
-                             xray_event_content.TextValue])
-                    else:
-                        data_parsed_dict[tag] = xray_event_content.TextValue
-
-
-                elif KEY_RDSR_UID in xray_event_content:
-                    if tag in data_parsed_dict.keys():
-                        data_parsed_dict[tag] =\
-                            [data_parsed_dict[tag], xray_event_content.UID]
-                    else:
-                        data_parsed_dict[tag] = xray_event_content.UID
-
-                # If the 'Irradiation Event X-Ray Data' contains subcontent
-                elif KEY_RDSR_CONTENT_SEQUENCE in xray_event_content:
-                    # For each subcontent
-                    for xray_event_subcontent in xray_event_content.\
-                            ContentSequence:
-                        # Reformat 'Concept Name'
-                        tag = (
-                            xray_event_subcontent.ConceptNameCodeSequence[0].
-                            CodeMeaning.replace(" ", "").replace("-", "").
-                            replace("(", "").replace(")", "").replace(".", ""))
-
-                        # corresponding value
-                        if KEY_RDSR_CONCEPT_CODE_SEQUENCE in xray_event_subcontent:
-                            if tag in data_parsed_dict.keys():
-                                data_parsed_dict[tag] = (
-                                    [data_parsed_dict[tag],
-                                     xray_event_subcontent
-                                     .ConceptCodeSequence[0].CodeMeaning])
-                            else:
-                                data_parsed_dict[tag] = (
-                                    xray_event_subcontent.
-                                    ConceptCodeSequence[0].CodeMeaning)
-
-                        elif KEY_RDSR_TEXT_VALUE in xray_event_subcontent:
-
-                            if tag in data_parsed_dict.keys():
-                                data_parsed_dict[tag] = (
-                                    [data_parsed_dict[tag],
-                                     xray_event_subcontent.TextValue])
-
-                            else:
-                                data_parsed_dict[tag] =\
-                                    xray_event_subcontent.TextValue
-
-                        elif KEY_RDSR_UID in xray_event_subcontent:
-                            if tag in data_parsed_dict.keys():
-                                data_parsed_dict[tag] = (
-                                    [data_parsed_dict[tag],
-                                     xray_event_subcontent.UID])
-                            else:
-                                data_parsed_dict[tag] =\
-                                    xray_event_subcontent.UID
-                        elif KEY_RDSR_MEASURED_VALUE_SEQUENCE in xray_event_subcontent:
-                            # Reformat 'Concept Name' to include unit of
-                            # measurement
-                            unit = xray_event_subcontent\
-                                .MeasuredValueSequence[0]\
-                                .MeasurementUnitsCodeSequence[0].CodeValue
-
-                            tag = '_'.join([tag, unit])
-
-                            if tag in data_parsed_dict.keys():
-                                data_parsed_dict[tag] = (
-                                    data_parsed_dict[tag],
-                                    xray_event_subcontent.
-                                    MeasuredValueSequence[0].NumericValue)
-                            else:
-                                data_parsed_dict[tag] =\
-                                    xray_event_subcontent.\
-                                    MeasuredValueSequence[0].NumericValue
-
-                        # Assign None to 'Concept Name' if nothing relevant to
-                        # parse in RDSR subcontent
-                        else:
-                            data_parsed_dict[tag] = None
-
-                # Assign None to 'Concept Name' if nothing relevant to parse
-                # in RDSR content
-                else:
-                    data_parsed_dict[tag] = None
-
-            # Append dictionary to DataFrame
-            data_parsed = data_parsed.append(data_parsed_dict,
-                                             ignore_index=True)
-
-    return data_parsed
+                _parse_content_item(
+                    item=xray_event_content, data_parsed_dict=data_parsed_dict)
+
+            data_parsed_events.append(data_parsed_dict)
+
+    return pd.DataFrame.from_records(data_parsed_events)
+
+
+def _parse_content_item(item: pydicom.Dataset,
+                        data_parsed_dict: Dict[str, Any]) -> None:
+    """Parse an RDSR content item of an irradiation event.
+
+    The value of the item is saved to data_parsed_dict, with the reformatted
+    'Concept Name' as key. Items with subcontent, e.g. 'X-Ray Filters', are
+    parsed recursively into the same dictionary.
+
+    Parameters
+    ----------
+    item : pydicom.Dataset
+        Content item of 'Irradiation Event X-Ray Data', or of one of its
+        containers.
+    data_parsed_dict : Dict[str, Any]
+        Parsed data of the irradiation event, updated in place.
+
+    """
+    # Reformat 'Concept Name'
+    tag = _clean_tag(item.ConceptNameCodeSequence[0].CodeMeaning)
+
+    # The value type tells which attribute holds the value, so read it once
+    # rather than testing for each attribute
+    value_type = item.ValueType
+
+    # Save 'Concept Name' to dictionary, assign corresponding value
+    if value_type == KEY_RDSR_VALUE_TYPE_CODE:
+        _save_value(data_parsed_dict, tag,
+                    item.ConceptCodeSequence[0].CodeMeaning)
+
+    elif value_type == KEY_RDSR_VALUE_TYPE_NUM:
+        measured_value = item.MeasuredValueSequence[0]
+
+        # Reformat 'Concept Name' to include unit of measurement
+        unit = measured_value.MeasurementUnitsCodeSequence[0]\
+            .CodeValue.translate(_UNIT_STRIP)
+
+        _save_value(data_parsed_dict, sys.intern('_'.join([tag, unit])),
+                    measured_value.NumericValue)
+
+    elif value_type == KEY_RDSR_VALUE_TYPE_TEXT:
+
+        # This extracts detector size for static acquisitions, which is given
+        # as a 'Comment' for siemens artis zee units
+        if tag == KEY_RDSR_COMMENT:
+            comment = item.TextValue.split('/')
+            if KEY_RDSR_ACQUISITION_DATA in comment[0]:
+                for index in comment:
+                    if KEY_RDSR_II_DIAMETER_SRDATA in index:
+                        data_parsed_dict[KEY_RDSR_DETECTORSIZE_MM] = \
+                            index.split('=')[1].replace('"', '')
+
+        else:
+            _save_value(data_parsed_dict, tag, item.TextValue)
+
+    elif value_type == KEY_RDSR_VALUE_TYPE_UIDREF:
+        _save_value(data_parsed_dict, tag, item.UID)
+
+    # If the content contains subcontent
+    elif value_type == KEY_RDSR_VALUE_TYPE_CONTAINER:
+        for subcontent in item.ContentSequence:
+            _parse_content_item(
+                item=subcontent, data_parsed_dict=data_parsed_dict)
+
+    # Assign None to 'Concept Name' if nothing relevant to parse in RDSR
+    # content
+    else:
+        data_parsed_dict[tag] = None
+
+
+def _save_value(data_parsed_dict: Dict[str, Any], tag: str, value: Any):
+    """Save a parsed value, pairing it with any earlier value of the tag.
+
+    Parameters
+    ----------
+    data_parsed_dict : Dict[str, Any]
+        Parsed data of the irradiation event, updated in place.
+    tag : str
+        Reformatted 'Concept Name' of the content item.
+    value : Any
+        Value of the content item.
+
+    """
+    if tag in data_parsed_dict:
+        data_parsed_dict[tag] = [data_parsed_dict[tag], value]
+    else:
+        data_parsed_dict[tag] = value
+
+
+@lru_cache(maxsize=1024)
+def _clean_tag(code_meaning: str) -> str:
+    """Reformat an RDSR 'Concept Name' CodeMeaning to a column name.
+
+    Spaces, hyphens, parentheses and dots are removed in a single pass, e.g.
+    'Distance Source to Isocenter' becomes 'DistanceSourcetoIsocenter'. The
+    same few concept names recur in every irradiation event, so each one is
+    only reformatted once. The column names are interned, so that the
+    dictionary of every event shares the same key objects.
+
+    Parameters
+    ----------
+    code_meaning : str
+        CodeMeaning of the ConceptNameCodeSequence of an RDSR content item.
+
+    Returns
+    -------
+    str
+        CodeMeaning without the characters in _TAG_STRIP.
+
+    """
+    return sys.intern(code_meaning.translate(_TAG_STRIP))
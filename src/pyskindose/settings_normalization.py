@@ -8,6 +8,10 @@ from pyskindose.constants import (
 )
 
 
+# Multiplicative correction factor of each direction in normalization settings
+DIRECTION_SIGNS = {'+': +1, '-': -1}
+
+
 class NormalizationSettings:
     """A class to normalize RDSR for PySkinDose compliance.
 
@@ -30,14 +34,14 @@ class NormalizationSettings:
 
     def __init__(self, normalization_settings, data_parsed):
         """Initialize class attributes."""
-        manufacturer = data_parsed[KEY_RDSR_MANUFACTURER][0]
+        manufacturer = data_parsed[KEY_RDSR_MANUFACTURER][0].lower()
         model = data_parsed[KEY_RDSR_MANUFACTURER_MODEL_NAME][0]
+        manufacturer_key = KEY_NORMALIZATION_MANUFACTURER.lower()
 
         # Select correct normalization settings
         for setting in normalization_settings['normalization_settings']:
 
-            if not (manufacturer.lower() ==
-                    setting[KEY_NORMALIZATION_MANUFACTURER.lower()].lower()
+            if not (manufacturer == setting[manufacturer_key].lower()
                     and model in setting[KEY_NORMALIZATION_MODELS]):
                 continue
 
@@ -81,22 +85,9 @@ class _RotationDirection:
             Each key contains either '+' or '-'.
 
         """
-        pos_dir = +1
-        neg_dir = -1
-
-        for dimension in directions:
-
-            if directions[dimension] == '+':
-                setattr(self, dimension, pos_dir)
-                continue
-
-            elif directions[dimension] == '-':
-                setattr(self, dimension, neg_dir)
-
-            else:
-                raise ValueError(
-                    f'direction {directions[dimension]} not understood. choose'
-                    'either  + or -')
+        vars(self).update(
+            {dimension: _fetch_direction_sign(direction=direction)
+             for dimension, direction in directions.items()})
 
         return
 
@@ -123,24 +114,38 @@ class _TranslationDirection:
             Each key contains either '+' or '-'.
 
         """
-        pos_dir = +1
-        neg_dir = -1
+        vars(self).update(
+            {dimension: _fetch_direction_sign(direction=direction)
+             for dimension, direction in directions.items()})
 
-        for dimension in directions:
+        return
 
-            if directions[dimension] == '+':
-                setattr(self, dimension, pos_dir)
-                continue
 
-            elif directions[dimension] == '-':
-                setattr(self, dimension, neg_dir)
+def _fetch_direction_sign(direction: str) -> int:
+    """Fetch the correction factor of a direction in normalization settings.
 
-            else:
-                raise ValueError(
-                    f'direction {directions[dimension]} not understood. choose'
-                    'either  + or -')
+    Parameters
+    ----------
+    direction : str
+        Either '+' or '-'.
 
-        return
+    Returns
+    -------
+    int
+        +1 for '+' and -1 for '-'.
+
+    Raises
+    ------
+    ValueError
+        If the direction is neither '+' nor '-'.
+
+    """
+    try:
+        return DIRECTION_SIGNS[direction]
+    except KeyError:
+        raise ValueError(
+            f'direction {direction} not understood. choose'
+            'either  + or -') from None
 
 
 class _TranslationOffset:
@@ -168,7 +173,6 @@ class _TranslationOffset:
             translation offset (in that direction), specified as a float in cm.
 
         """
-        for dimension in offset:
-            setattr(self, dimension, offset[dimension])
+        vars(self).update(offset)
 
         return
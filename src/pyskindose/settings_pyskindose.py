@@ -1,7 +1,10 @@
+from functools import lru_cache
 import json
+import sys
 from typing import Union
 
 from pyskindose.constants import (
+    DIMENSION_UNIT_KEY,
     KEY_PARAM_MODE,
     KEY_PARAM_RDSR_FILENAME,
     KEY_PARAM_ESTIMATE_K_TAB,
@@ -14,6 +17,40 @@ from pyskindose.constants import (
 )
 
 
+# Types of settings that are printed as values, other attributes are nested
+# settings objects with their own attrs_str
+PRINTABLE_SETTING_TYPES = (str, float, bool, int)
+
+
+class _LazyAttrsStr:
+    """Printable attribute string of a settings class, created on demand.
+
+    The string is created with create_attrs_str the first time it is
+    accessed and then stored on the instance, so that settings that are
+    never printed never format it. Call update_attrs_str on the instance to
+    have it recreated on next access, e.g. after a setting has changed.
+
+    """
+
+    def __init__(self, object_name: str, indent_level: int):
+        self.object_name = object_name
+        self.indent_level = indent_level
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        attrs_str = create_attrs_str(
+            attrs_parent=instance,
+            object_name=self.object_name,
+            indent_level=self.indent_level)
+
+        # The instance attribute shadows this descriptor on later accesses
+        instance.__dict__['attrs_str'] = attrs_str
+
+        return attrs_str
+
+
 class PyskindoseSettings:
     """A class to store all settings required to run PySkinDose.
 
@@ -66,11 +103,13 @@ class PyskindoseSettings:
 
         """
         if isinstance(settings, str):
-            tmp = json.loads(settings)
+            tmp = _parse_settings_json(settings)
         else:
             tmp = settings
 
-        self.mode = tmp[KEY_PARAM_MODE]
+        # The mode is compared against the MODE_* constants when dispatching,
+        # interning lets those comparisons succeed on identity
+        self.mode = sys.intern(tmp[KEY_PARAM_MODE])
         self.k_tab_val = tmp[KEY_PARAM_K_TAB_VAL]
         self.rdsr_filename = tmp[KEY_PARAM_RDSR_FILENAME]
         self.estimate_k_tab = tmp[KEY_PARAM_ESTIMATE_K_TAB]
@@ -129,6 +168,8 @@ class PhantomSettings:
 
     """
 
+    attrs_str = _LazyAttrsStr(object_name='phantom', indent_level=0)
+
     def __init__(self, ptm_dim: dict):
         """Initialize phantom settings class.
 
@@ -140,23 +181,17 @@ class PhantomSettings:
 
         """
 
-        self.model = ptm_dim[KEY_PARAM_PHANTOM_MODEL]
+        # Model and orientation are compared against the PHANTOM_MODEL_* and
+        # orientation constants, interning lets those succeed on identity
+        self.model = sys.intern(ptm_dim[KEY_PARAM_PHANTOM_MODEL])
         self.human_mesh = ptm_dim[KEY_PARAM_HUMAN_MESH]
-        self.patient_orientation = ptm_dim["patient_orientation"]
+        self.patient_orientation = sys.intern(
+            ptm_dim["patient_orientation"])
         self.patient_offset = PatientOffset(offset=ptm_dim["patient_offset"])
         self.dimension = PhantomDimensions(ptm_dim=ptm_dim['dimension'])
 
-        self.attrs_str = create_attrs_str(
-            attrs_parent=self,
-            object_name='phantom',
-            indent_level=0)
-        return
-
     def update_attrs_str(self):
-        self.attrs_str = create_attrs_str(
-            attrs_parent=self,
-            object_name='phantom',
-            indent_level=0)
+        vars(self).pop('attrs_str', None)
 
 
 class PhantomDimensions:
@@ -197,9 +232,13 @@ class PhantomDimensions:
         Width of the patient support table phantom.
     pad_length : int
         Length of the patient support table phantom.
+    unit : str, optional
+        Unit of the dimensions, e.g. "cm", if given in the settings.
 
     """
 
+    attrs_str = _LazyAttrsStr(object_name='dimension', indent_level=1)
+
     def __init__(self, ptm_dim: dict):
         """Initialize phantom dimension class.
 
@@ -210,19 +249,15 @@ class PhantomDimensions:
             appended as attributes to this class, see class attributes.
 
         """
-        for dimension in ptm_dim.keys():
-            setattr(self, dimension, ptm_dim[dimension])
+        vars(self).update(ptm_dim)
 
-        self.attrs_str = create_attrs_str(
-            attrs_parent=self,
-            object_name='dimensions',
-            indent_level=1)
+        # The unit is a short, repeated settings string, interned like the
+        # phantom model
+        if DIMENSION_UNIT_KEY in ptm_dim:
+            self.unit = sys.intern(ptm_dim[DIMENSION_UNIT_KEY])
 
     def update_attrs_str(self):
-        self.attrs_str = create_attrs_str(
-            attrs_parent=self,
-            object_name='dimension',
-            indent_level=1)
+        vars(self).pop('attrs_str', None)
 
 
 class PatientOffset:
@@ -249,6 +284,8 @@ class PatientOffset:
 
     """
 
+    attrs_str = _LazyAttrsStr(object_name='patient offset', indent_level=1)
+
     def __init__(self, offset: dict):
         """Initialize patient-table offset class.
 
@@ -264,16 +301,8 @@ class PatientOffset:
         self.d_ver = offset[OFFSET_VERTICAL_KEY]
         self.d_lon = offset[OFFSET_LONGITUDINAL_KEY]
 
-        self.attrs_str = create_attrs_str(
-            attrs_parent=self,
-            object_name='patient offset',
-            indent_level=1)
-
     def update_attrs_str(self):
-        self.attrs_str = create_attrs_str(
-            attrs_parent=self,
-            object_name='patient offset',
-            indent_level=1)
+        vars(self).pop('attrs_str', None)
 
 class Plotsettings:
     """A class for setting plot settings.
@@ -304,6 +333,8 @@ class Plotsettings:
 
     """
 
+    attrs_str = _LazyAttrsStr(object_name='plot', indent_level=0)
+
     def __init__(self, plt_dict):
         """Initialize plot settings class.
 
@@ -313,19 +344,33 @@ class Plotsettings:
             Dictionary containing all of the plot setting that are
             appended as attributes to this class, see class attributes.
         """
-        for key in plt_dict.keys():
-            setattr(self, key, plt_dict[key])
-
-        self.attrs_str = create_attrs_str(
-            attrs_parent=self,
-            object_name='plot',
-            indent_level=0)
+        vars(self).update(plt_dict)
 
     def update_attrs_str(self):
-        self.attrs_str = create_attrs_str(
-            attrs_parent=self,
-            object_name='plot',
-            indent_level=0)
+        vars(self).pop('attrs_str', None)
+
+
+@lru_cache(maxsize=32)
+def _parse_settings_json(settings: str) -> dict:
+    """Parse a settings .json string, once per distinct string.
+
+    The settings classes only read from the parsed dictionary, so it is
+    shared between settings created from the same string, e.g. when
+    processing many RDSR files with the same settings.
+
+    Parameters
+    ----------
+    settings : str
+        .json string containing all the settings parameters required to run
+        PySkinDose.
+
+    Returns
+    -------
+    dict
+        The parsed settings.
+
+    """
+    return json.loads(settings)
 
 
 def create_attrs_str(
@@ -340,14 +385,15 @@ def create_attrs_str(
     indent_marker_title = (indent_level) * indent_size * indent_sign
     indent_marker_objs = indent_marker_title + indent_size * indent_sign
 
-    attrs_str = indent_marker_title + object_name + '\n'
+    # Collect the lines and join them once, rather than re-copying the string
+    # for every attribute
+    attrs_lines = [indent_marker_title + object_name + '\n']
 
     for key, val in attrs_dict.items():
-        if type(val) in [str, float, bool, int]:
+        if isinstance(val, PRINTABLE_SETTING_TYPES):
             if not key == 'attrs_str':
-                attrs_str = attrs_str + \
-                    indent_marker_objs + str(key) + ' : ' + str(val) + '\n'
+                attrs_lines.append(f"{indent_marker_objs}{key} : {val}\n")
         else:
-            attrs_str = attrs_str + '\n' + getattr(attrs_parent, key).attrs_str
+            attrs_lines.append('\n' + getattr(attrs_parent, key).attrs_str)
 
-    return attrs_str
+    return ''.join(attrs_lines)
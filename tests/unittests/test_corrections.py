@@ -1,6 +1,3 @@
-from pathlib import Path
-import sys
-
 import numpy as np
 import pandas as pd
 
@@ -9,9 +6,6 @@ from pyskindose.corrections import calculate_k_med
 from pyskindose.corrections import calculate_k_isq
 from pyskindose.db_connect import db_connect
 
-P = Path(__file__).parent.parent.parent
-sys.path.insert(1, str(P.absolute()))
-
 
 def test_calculate_unchanged_fluence_at_refernce_distance():
     expected = 1
@@ -38,10 +32,8 @@ def test_calculate_decreased_fluence_at_increased_distance():
 
 
 def test_fetch_correct_backscatter_correction_from_database():
-    expected = 5 * [True]
-
     # Tabulated backscatter factor for param in data_norm
-    tabulated_k_bs = [1.3, 1.458, 1.589, 1.617, 1.639]
+    tabulated_k_bs = np.array([1.3, 1.458, 1.589, 1.617, 1.639])
 
     data_norm = pd.DataFrame({'kVp': 5 * [80], 'HVL': 5 * [7.88],
                               'FSL': [5, 10, 20, 25, 35]})
@@ -52,12 +44,10 @@ def test_fetch_correct_backscatter_correction_from_database():
     # interpolate at tabulated filed sizes
     k_bs = bs_interp[0](data_norm.FSL)
 
-    diff = [100 * (abs(k_bs[i] - tabulated_k_bs[i])) / tabulated_k_bs[i]
-            for i in range(len(tabulated_k_bs))]
+    # percent difference from tabulated values should be at most 1 %
+    diff = 100 * np.abs(k_bs - tabulated_k_bs) / tabulated_k_bs
 
-    test = [percent_difference <= 1 for percent_difference in diff]
-
-    assert expected == test
+    assert np.all(diff <= 1)
 
 
 def test_fetch_correct_medium_correction_from_database():
@@ -0,0 +1,47 @@
+import os
+
+import plotly.graph_objects as go
+import pytest
+
+from pyskindose import constants as c
+from pyskindose.plotting.create_plot_and_save_to_file import (
+    create_plot_and_save_to_file)
+
+
+def _create_event_frames(events):
+    return [go.Frame(data=[go.Scatter3d(x=[event], y=[0], z=[0])],
+                     name=str(event))
+            for event in events]
+
+
+def test_jpeg_frames_saves_one_image_per_frame(monkeypatch, tmp_path):
+    events = [0, 4, 9]
+    output_dir = tmp_path / "frames"
+
+    requested_files = []
+    monkeypatch.setattr(
+        go.Figure, "write_image",
+        lambda self, file, *args, **kwargs: requested_files.append(file))
+
+    create_plot_and_save_to_file(
+        mode=c.MODE_PLOT_PROCEDURE,
+        data=[go.Scatter3d(x=[0], y=[0], z=[0])],
+        layout={},
+        frames=_create_event_frames(events),
+        output_format=c.PLOT_OUTPUT_FORMAT_JPEG_FRAMES,
+        output_dir=str(output_dir))
+
+    expected = [os.path.join(str(output_dir), f"plot_procedure_{event}.jpeg")
+                for event in events]
+
+    assert requested_files == expected
+    assert output_dir.is_dir()
+
+
+def test_jpeg_frames_without_frames_raises_value_error():
+    with pytest.raises(ValueError, match="frames"):
+        create_plot_and_save_to_file(
+            mode=c.MODE_PLOT_PROCEDURE,
+            data=[go.Scatter3d(x=[0], y=[0], z=[0])],
+            layout={},
+            output_format=c.PLOT_OUTPUT_FORMAT_JPEG_FRAMES)
@@ -1,11 +1,9 @@
-from pathlib import Path
 import numpy as np
-import sys
+import pandas as pd
+import pytest
 
-from pyskindose.geom_calc import Triangle
+from pyskindose.geom_calc import Triangle, fetch_and_append_hvl
 
-P = Path(__file__).parent.parent.parent
-sys.path.insert(1, str(P.absolute()))
 
 def test_triangle_check_intersection():
     """Test of intersection algoritm.
@@ -60,4 +58,31 @@ def test_triangle_check_intersection():
 
     assert expected == test
 
+
+def test_fetch_and_append_hvl_looks_up_hvl_of_each_event():
+    """Test that each event gets the tabulated HVL of its geometry.
+
+    kVp is rounded to the nearest integer before the lookup.
+    """
+    expected = [5.84, 3.71, 6.76, 5.84]
+
+    data_norm = pd.DataFrame({
+        'model': 4 * ['AXIOM-Artis'],
+        'kVp': [70.0, 79.6, 80.8, 70.2],
+        'filter_thickness_Cu': [0.3, 0.0, 0.3, 0.3]})
+
+    test = fetch_and_append_hvl(data_norm).HVL.tolist()
+
+    assert expected == test
+
+
+def test_fetch_and_append_hvl_raises_for_event_without_tabulated_hvl():
+    data_norm = pd.DataFrame({
+        'model': 2 * ['AXIOM-Artis'],
+        'kVp': [80.0, 200.0],
+        'filter_thickness_Cu': [0.3, 0.3]})
+
+    with pytest.raises(ValueError, match=r"\[1\]"):
+        fetch_and_append_hvl(data_norm)
+
 test_triangle_check_intersection()
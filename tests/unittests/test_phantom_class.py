@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+
+from pyskindose.phantom_class import Phantom
+from pyskindose.settings_pyskindose import PhantomDimensions
+from pyskindose.dev_data import DEVELOPMENT_PARAMETERS
+
+
+def test_position_all_equals_position_in_each_event():
+    """Test that the vectorized phantom positioning matches position.
+
+    Position a table phantom for a few irradiation events with table
+    translations and rotations, both event by event and all at once.
+    """
+    data_norm = pd.DataFrame(dict(
+        Tx=[0.0, 10.0, -5.0], Ty=[0.0, 2.5, 7.0], Tz=[0.0, -20.0, 3.0],
+        At1=[0.0, 15.0, -30.0], At2=[0.0, 5.0, 10.0], At3=[0.0, -8.0, 0.0]))
+
+    table = Phantom(
+        phantom_model="table",
+        phantom_dim=PhantomDimensions(DEVELOPMENT_PARAMETERS["phantom"]["dimension"]))
+    table.save_position()
+
+    positions = table.position_all(data_norm)
+
+    assert positions.shape == (len(data_norm), len(table.r_ref), 3)
+
+    for event in range(len(data_norm)):
+        table.position(data_norm, event)
+        np.testing.assert_allclose(positions[event], table.r, atol=1e-10)
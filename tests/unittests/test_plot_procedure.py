@@ -0,0 +1,124 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pyskindose.plotting.plot_procedure as plot_procedure_module
+from pyskindose import constants as c
+from pyskindose.dev_data import DEVELOPMENT_PARAMETERS
+from pyskindose.phantom_class import Phantom
+from pyskindose.plotting.plot_procedure import (
+    EVENT_GEOMETRY_PARAMETERS,
+    _select_slider_events,
+    clear_plot_procedure_cache,
+    plot_procedure,
+)
+from pyskindose.rdsr_normalizer import rdsr_normalizer
+from pyskindose.rdsr_parser import load_rdsr, rdsr_parser
+from pyskindose.settings_pyskindose import PhantomDimensions
+
+RDSR_PATH = os.path.join(
+    os.path.dirname(c.__file__), "example_data", "RDSR", "S1.dcm")
+
+
+def _create_table_and_pad(dimension=None):
+    phantom_dim = PhantomDimensions(
+        dimension or DEVELOPMENT_PARAMETERS["phantom"]["dimension"])
+
+    table = Phantom(phantom_model=c.PHANTOM_MODEL_TABLE,
+                    phantom_dim=phantom_dim)
+    pad = Phantom(phantom_model=c.PHANTOM_MODEL_PAD, phantom_dim=phantom_dim)
+
+    table.save_position()
+    pad.save_position()
+
+    return table, pad
+
+
+def test_plot_procedure_reuses_phantom_positions_from_previous_call(
+        monkeypatch):
+    """Test that cached phantom positions are reused between calls.
+
+    A second call with identical phantoms should not position any phantom,
+    while a call with a changed phantom should position the phantoms again.
+    """
+    data_norm = rdsr_normalizer(rdsr_parser(load_rdsr(RDSR_PATH)))
+
+    monkeypatch.setattr(plot_procedure_module,
+                        "create_plot_and_save_to_file",
+                        lambda **kwargs: None)
+
+    positioned = []
+    position_all = Phantom.position_all
+
+    def spy_position_all(self, data_norm):
+        positioned.append(len(data_norm))
+        return position_all(self, data_norm)
+
+    monkeypatch.setattr(Phantom, "position_all", spy_position_all)
+
+    clear_plot_procedure_cache()
+
+    for _ in range(2):
+        table, pad = _create_table_and_pad()
+        plot_procedure(mode=c.MODE_PLOT_PROCEDURE, data_norm=data_norm,
+                       table=table, pad=pad, include_patient=False)
+
+    # table and pad positioned in the first call only
+    assert len(positioned) == 2
+
+    dimension = dict(DEVELOPMENT_PARAMETERS["phantom"]["dimension"])
+    dimension[c.DIMENSION_TABLE_WIDTH] += 10
+    table, pad = _create_table_and_pad(dimension=dimension)
+    plot_procedure(mode=c.MODE_PLOT_PROCEDURE, data_norm=data_norm,
+                   table=table, pad=pad, include_patient=False)
+
+    assert len(positioned) == 4
+
+    clear_plot_procedure_cache()
+
+
+def _create_event_geometries(total_events):
+    rng = np.random.default_rng(0)
+
+    return pd.DataFrame(
+        rng.normal(size=(total_events, len(EVENT_GEOMETRY_PARAMETERS))),
+        columns=EVENT_GEOMETRY_PARAMETERS)
+
+
+def test_select_slider_events_keeps_all_events_up_to_max_events():
+    data_norm = _create_event_geometries(total_events=10)
+
+    assert _select_slider_events(data_norm, max_events=10) == list(range(10))
+    assert _select_slider_events(data_norm, max_events=50) == list(range(10))
+
+
+def test_select_slider_events_downsamples_to_max_events():
+    """Test the LTTB downsampling of the slider events.
+
+    Exactly max_events sorted and distinct events should be selected, always
+    including the first and the last event.
+    """
+    total_events = 200
+    data_norm = _create_event_geometries(total_events=total_events)
+
+    for max_events in [3, 4, 17, 199]:
+        events = _select_slider_events(data_norm, max_events=max_events)
+
+        assert len(events) == max_events
+        assert events == sorted(set(events))
+        assert events[0] == 0
+        assert events[-1] == total_events - 1
+
+
+@pytest.mark.parametrize("max_slider_events", [0, 1, 2])
+def test_plot_procedure_requires_at_least_three_slider_events(
+        max_slider_events):
+    table, pad = _create_table_and_pad()
+
+    with pytest.raises(ValueError, match="max_slider_events"):
+        plot_procedure(mode=c.MODE_PLOT_PROCEDURE,
+                       data_norm=_create_event_geometries(total_events=10),
+                       table=table, pad=pad, include_patient=False,
+                       max_slider_events=max_slider_events)
@@ -0,0 +1,116 @@
+from pydicom.dataset import Dataset
+from pydicom.sequence import Sequence
+
+from pyskindose.constants import (
+    KEY_RDSR_DETECTORSIZE_MM,
+    KEY_RDSR_EVENT_XRAY_DATA_CODE_VALUE,
+    KEY_RDSR_MANUFACTURER,
+    KEY_RDSR_MANUFACTURER_MODEL_NAME,
+)
+from pyskindose.rdsr_parser import rdsr_parser
+
+
+def _create_code(code_meaning, code_value="0"):
+    code = Dataset()
+    code.CodeValue = code_value
+    code.CodeMeaning = code_meaning
+
+    return Sequence([code])
+
+
+def _create_content_item(value_type, concept_name, concept_code_value="0"):
+    item = Dataset()
+    item.ValueType = value_type
+    item.ConceptNameCodeSequence = _create_code(
+        concept_name, code_value=concept_code_value)
+
+    return item
+
+
+def _create_num_item(concept_name, value, unit):
+    item = _create_content_item("NUM", concept_name)
+
+    measured_value = Dataset()
+    measured_value.NumericValue = value
+    measured_value.MeasurementUnitsCodeSequence = _create_code(
+        "unit", code_value=unit)
+    item.MeasuredValueSequence = Sequence([measured_value])
+
+    return item
+
+
+def _create_code_item(concept_name, code_meaning):
+    item = _create_content_item("CODE", concept_name)
+    item.ConceptCodeSequence = _create_code(code_meaning)
+
+    return item
+
+
+def _create_text_item(concept_name, text):
+    item = _create_content_item("TEXT", concept_name)
+    item.TextValue = text
+
+    return item
+
+
+def _create_container(concept_name, content, concept_code_value="0"):
+    item = _create_content_item(
+        "CONTAINER", concept_name, concept_code_value=concept_code_value)
+    item.ContentSequence = Sequence(content)
+
+    return item
+
+
+def _create_x_ray_filter(material, thickness):
+    return _create_container("X-Ray Filters", [
+        _create_code_item("X-Ray Filter Material", material),
+        _create_num_item("X-Ray Filter Thickness Maximum", thickness, "mm")])
+
+
+def test_rdsr_parser_parses_nested_irradiation_event_content():
+    """Test parsing of nested content of an irradiation event.
+
+    Units of nested measurements should have dots removed, values of tags
+    repeated in separate containers should be paired in a list, and the
+    detector size should be read from a nested acquisition comment. Content
+    that is not an irradiation event should be skipped.
+    """
+    uid = _create_content_item("UIDREF", "Irradiation Event UID")
+    uid.UID = "1.2.3"
+
+    event = _create_container(
+        "Irradiation Event X-Ray Data",
+        concept_code_value=KEY_RDSR_EVENT_XRAY_DATA_CODE_VALUE,
+        content=[
+            uid,
+            _create_x_ray_filter("Copper or Copper compound", "0.1"),
+            _create_x_ray_filter("Aluminum or Aluminum compound", "1.0"),
+            _create_container("Irradiation Event Dose", [
+                _create_num_item("Dose Area Product", "2.5", "Gy.m2"),
+                _create_container("Acquisition Comment", [
+                    _create_text_item(
+                        "Comment",
+                        'AcquisitionData/iiDiameter SRData="250"')])])])
+
+    data_raw = Dataset()
+    data_raw.Manufacturer = "Siemens"
+    data_raw.ManufacturerModelName = "AXIOM-Artis"
+    data_raw.ContentSequence = Sequence([
+        _create_code_item("Procedure reported", "Projection X-Ray"),
+        event])
+
+    data_parsed = rdsr_parser(data_raw)
+
+    assert len(data_parsed) == 1
+
+    expected = {
+        KEY_RDSR_MANUFACTURER: "Siemens",
+        KEY_RDSR_MANUFACTURER_MODEL_NAME: "AXIOM-Artis",
+        "IrradiationEventUID": "1.2.3",
+        "XRayFilterMaterial": [
+            "Copper or Copper compound", "Aluminum or Aluminum compound"],
+        "XRayFilterThicknessMaximum_mm": [0.1, 1.0],
+        "DoseAreaProduct_Gym2": 2.5,
+        KEY_RDSR_DETECTORSIZE_MM: "250"}
+
+    assert data_parsed.iloc[0].to_dict() == expected